@@ -83,7 +83,7 @@ from civ7_modding_tools.nodes import (
     LeaderCivilizationBiasNode,
 )
 from civ7_modding_tools.localizations import BaseLocalization
-from civ7_modding_tools.utils import locale
+from civ7_modding_tools.utils import kebab_case, locale, trim
 
 T = TypeVar("T")
 
@@ -254,7 +254,6 @@ class CivilizationBuilder(BaseBuilder):
 
     def migrate(self) -> "CivilizationBuilder":
         """Migrate and populate all database variants with full localization."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import EnglishTextNode
         
         if not self.civilization_type:
@@ -1259,7 +1258,6 @@ class CivilizationBuilder(BaseBuilder):
         self.migrate()
         
         # Generate path from civilization type (trimmed + kebab-case)
-        from civ7_modding_tools.utils import trim, kebab_case
         trimmed = trim(self.civilization_type)
         path = f"/civilizations/{kebab_case(trimmed)}/"
         
@@ -1358,8 +1356,6 @@ class UnitBuilder(BaseBuilder):
 
     def migrate(self) -> "UnitBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
-        
         if not self.unit_type:
             return self
         
@@ -1742,7 +1738,6 @@ class UnitBuilder(BaseBuilder):
         # ==== POPULATE _visual_remap DATABASE ====
         if self.visual_remap:
             from civ7_modding_tools.nodes import VisualRemapRowNode
-            from civ7_modding_tools.utils import locale
             from civ7_modding_tools.data import get_units
             
             remap_to = self.visual_remap.get('to')
@@ -1931,7 +1926,6 @@ class UnitBuilder(BaseBuilder):
         self.migrate()
         
         # Generate path from base_unit_type if set (for upgrade chains), otherwise unit_type
-        from civ7_modding_tools.utils import trim, kebab_case
         path_unit_type = self.base_unit_type if self.base_unit_type else self.unit_type
         trimmed = trim(path_unit_type)
         path = f"/units/{kebab_case(trimmed)}/"
@@ -2121,8 +2115,6 @@ class ConstructibleBuilder(BaseBuilder):
 
     def migrate(self) -> "ConstructibleBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
-        
         if not self.constructible_type:
             return self
         
@@ -2447,7 +2439,6 @@ class ConstructibleBuilder(BaseBuilder):
         # ==== POPULATE _visual_remap DATABASE ====
         if self.visual_remap:
             from civ7_modding_tools.nodes import VisualRemapRowNode
-            from civ7_modding_tools.utils import locale
             from civ7_modding_tools.data import get_constructibles
             
             remap_to = self.visual_remap.get('to') if isinstance(self.visual_remap, dict) else self.visual_remap
@@ -2487,7 +2478,6 @@ class ConstructibleBuilder(BaseBuilder):
         self.migrate()
         
         # Generate path from constructible type (trimmed + kebab-case)
-        from civ7_modding_tools.utils import trim, kebab_case
         trimmed = trim(self.constructible_type)
         path = f"/constructibles/{kebab_case(trimmed)}/"
         
@@ -2562,7 +2552,6 @@ class ProgressionTreeBuilder(BaseBuilder):
 
     def migrate(self) -> "ProgressionTreeBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import (
             ProgressionTreeNode,
             ProgressionTreePrereqNode,
@@ -2719,8 +2708,6 @@ class ProgressionTreeBuilder(BaseBuilder):
 
     def build(self) -> list[BaseFile]:
         """Build progression tree files."""
-        from civ7_modding_tools.utils import trim, kebab_case
-        
         files: list[BaseFile] = []
         
         if not self.progression_tree_type:
@@ -2790,7 +2777,6 @@ class ProgressionTreeNodeBuilder(BaseBuilder):
 
     def migrate(self) -> "ProgressionTreeNodeBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import (
             ProgressionTreeNodeNode,
             TypeQuoteNode,
@@ -3081,7 +3067,6 @@ class ModifierBuilder(BaseBuilder):
     def migrate(self) -> "ModifierBuilder":
         """Migrate and populate all database variants."""
         import uuid
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import GameEffectNode, EnglishTextNode
         from civ7_modding_tools.nodes.nodes import ModifierNode
         
@@ -3219,7 +3204,6 @@ class GameModifierBuilder(BaseBuilder):
 
     def migrate(self) -> "GameModifierBuilder":
         """Migrate and populate game modifier database variants."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import EnglishTextNode
         
         modifier_type = self.modifier_type or self.modifier.get('modifier_type')
@@ -3298,7 +3282,6 @@ class UnitAbilityBuilder(BaseBuilder):
 
     def migrate(self) -> "UnitAbilityBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import (
             UnitAbilityNode,
             UnitAbilityModifierNode,
@@ -3461,7 +3444,6 @@ class TraditionBuilder(BaseBuilder):
 
     def migrate(self) -> "TraditionBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import TraditionNode
         from civ7_modding_tools.nodes.database import TraditionModifierNode
         
@@ -3567,8 +3549,6 @@ class TraditionBuilder(BaseBuilder):
     
     def build(self) -> list[BaseFile]:
         """Build tradition files."""
-        from civ7_modding_tools.utils import trim, kebab_case
-        
         files: list[BaseFile] = []
         
         if not self.tradition_type:
@@ -3636,7 +3616,6 @@ class UniqueQuarterBuilder(BaseBuilder):
 
     def migrate(self) -> "UniqueQuarterBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
         from civ7_modding_tools.nodes import (
             UniqueQuarterNode,
             UniqueQuarterModifierNode,
@@ -3761,8 +3740,6 @@ class UniqueQuarterBuilder(BaseBuilder):
 
     def build(self) -> list[BaseFile]:
         """Build unique quarter files."""
-        from civ7_modding_tools.utils import kebab_case
-        
         files: list[BaseFile] = []
         
         if not self.unique_quarter_type:
@@ -4060,8 +4037,6 @@ class GreatPersonBuilder(UnitBuilder):
     
     def migrate(self) -> "GreatPersonBuilder":
         """Migrate great person properties."""
-        from civ7_modding_tools.utils import locale
-        
         if not self.unit_type or not self.great_person_type:
             return self
         
@@ -4162,8 +4137,6 @@ class GreatPersonBuilder(UnitBuilder):
     
     def _kebab_case_path(self) -> str:
         """Generate kebab-case path from unit type."""
-        from civ7_modding_tools.utils import trim, kebab_case
-        
         trimmed = trim(self.unit_type)
         return kebab_case(trimmed)
 
@@ -4192,8 +4165,6 @@ class NamedPlaceBuilder(BaseBuilder):
     
     def migrate(self) -> "NamedPlaceBuilder":
         """Migrate and populate all database variants."""
-        from civ7_modding_tools.utils import locale
-        
         if not self.named_place_type:
             return self
         
@@ -4317,7 +4288,5 @@ class NamedPlaceBuilder(BaseBuilder):
     
     def _kebab_case_path(self) -> str:
         """Generate kebab-case path from named place type."""
-        from civ7_modding_tools.utils import trim, kebab_case
-        
         trimmed = trim(self.named_place_type)
         return kebab_case(trimmed)
@@ -358,8 +358,7 @@ class Mod:
         modinfo_file_obj = ModInfoFile(modinfo_path, str(modinfo_file))
         
         # Write all generated files
-        for file in all_files:
-            file.write(str(dist_path))
+        BaseFile.write_many(all_files, str(dist_path))
         
         return [modinfo_file_obj] + all_files
 
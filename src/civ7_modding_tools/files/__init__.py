@@ -2,15 +2,42 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Union, TYPE_CHECKING, Any, Dict, List
+from typing import Optional, Union, TYPE_CHECKING, Any, Callable, Dict, List, TextIO
+import io
 import shutil
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from civ7_modding_tools.nodes import BaseNode
-from civ7_modding_tools.xml_builder import XmlBuilder
+from civ7_modding_tools.xml_builder import XmlBuilder, XmlRow
 
 if TYPE_CHECKING:
     from civ7_modding_tools.nodes import DatabaseNode
 
 
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>'
+_XML_FOOTER = '<!-- generated with https://github.com/Phlair/civ7-modding-tools -->'
+_XML_INDENT = '    '
+
+def _open_for_write(path: Path) -> TextIO:
+    """
+    Open a text file for writing, creating its directory only when missing.
+    
+    Attempting the open first avoids a mkdir/stat round-trip for every file
+    written into a directory that already exists.
+    
+    Args:
+        path: Output file path
+        
+    Returns:
+        Writable text file object
+    """
+    try:
+        return open(path, "w", encoding="UTF-8")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, "w", encoding="UTF-8")
+
+
 class BaseFile(ABC):
     """
     Abstract base class for output files.
@@ -80,6 +107,55 @@ class BaseFile(ABC):
         """
         pass
 
+    def serialize(self) -> Optional[str]:
+        """
+        Render this file's content to a string without touching disk.
+        
+        Returns:
+            File content, or None if the file is not text-rendered (e.g. copied assets)
+        """
+        return None
+
+    def _write_text(self, dist: str, data: str) -> None:
+        """
+        Write already-serialized content to this file's output location.
+        
+        Args:
+            dist: Absolute path to distribution directory
+            data: Serialized file content
+        """
+        output_file = Path(dist) / self.path.strip("/") / self.name
+        with _open_for_write(output_file) as f:
+            f.write(data)
+
+    @classmethod
+    def write_many(cls, files: list["BaseFile"], dist: str, max_workers: int = 8) -> None:
+        """
+        Write several files, overlapping their disk I/O on a thread pool.
+        
+        Content is serialized on the calling thread (node serialization is not
+        thread-safe); only the file system writes are dispatched to workers.
+        
+        Args:
+            files: Files to write
+            dist: Absolute path to distribution directory
+            max_workers: Maximum number of writer threads
+        """
+        jobs: List[tuple[Callable[..., None], tuple[str, ...]]] = []
+        for file in files:
+            if file.is_empty:
+                continue
+            data = file.serialize()
+            if data is None:
+                jobs.append((file.write, (dist,)))
+            else:
+                jobs.append((file._write_text, (dist, data)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fn, *args) for fn, args in jobs]
+            for future in futures:
+                future.result()
+
     def __repr__(self) -> str:
         """String representation of the file."""
         return f"{self.__class__.__name__}(path={self.path!r}, name={self.name!r})"
@@ -126,33 +202,28 @@ class XmlFile(BaseFile):
         if self.is_empty:
             return
         
-        # Build output directory
-        output_dir = Path(dist) / self.path.strip("/")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Build output file path
-        output_file = output_dir / self.name
-        
-        # Serialize content to XML using new XmlBuilder
-        xml_content = self._serialize_content(self.content)
+        self._write_text(dist, self.serialize())
+
+    def serialize(self) -> str:
+        """
+        Render this file's content as an XML document string.
         
-        # Write to file
-        with open(output_file, "w", encoding="UTF-8") as f:
-            f.write(xml_content)
+        Returns:
+            XML string (empty if the content produces no rows)
+        """
+        return self._serialize_content(self.content)
 
-    def _build_element_recursive(self, data: dict) -> Optional[Any]:
+    def _build_element_recursive(self, data: Union[dict, XmlRow]) -> Optional[Any]:
         """
         Recursively build XML elements from jstoxml-format dict.
         
         Args:
-            data: Dict with _name, _attrs, and optionally _content
+            data: XmlRow or dict with _name, _attrs, and optionally _content
             
         Returns:
             ET.Element or None
         """
-        import xml.etree.ElementTree as ET
-        
-        if not isinstance(data, dict):
+        if not isinstance(data, (dict, XmlRow)):
             return None
         
         elem_name = data.get('_name')
@@ -170,7 +241,10 @@ class XmlFile(BaseFile):
         content = data.get('_content')
         if content:
             if isinstance(content, str):
-                elem.text = content
+                # Whitespace-only text is dropped so the element self-closes
+                text = content.strip()
+                if text:
+                    elem.text = text
             elif isinstance(content, list):
                 for child_data in content:
                     child_elem = self._build_element_recursive(child_data)
@@ -179,48 +253,6 @@ class XmlFile(BaseFile):
         
         return elem
 
-    def _element_to_string(self, elem: Any, indent: str = '    ', level: int = 0) -> str:
-        """
-        Convert ET.Element to pretty-printed XML string.
-        
-        Args:
-            elem: Element to convert
-            indent: Indentation string
-            level: Current indentation level
-            
-        Returns:
-            Formatted XML string
-        """
-        # Build opening tag with attributes
-        attrs_str = ""
-        if elem.attrib:
-            attrs_list = [f'{k}="{v}"' for k, v in elem.attrib.items()]
-            attrs_str = " " + " ".join(attrs_list)
-        
-        current_indent = indent * level
-        
-        # Handle self-closing tags (no children, no text)
-        if len(elem) == 0 and not (elem.text and elem.text.strip()):
-            return f"{current_indent}<{elem.tag}{attrs_str}/>"
-        
-        # Has children or text
-        result = f"{current_indent}<{elem.tag}{attrs_str}>"
-        
-        # Add text content if present
-        if elem.text and elem.text.strip():
-            result += elem.text.strip()
-        
-        # Add children
-        if len(elem) > 0:
-            result += "\n"
-            for child in elem:
-                result += self._element_to_string(child, indent, level + 1) + "\n"
-            result += current_indent
-        
-        result += f"</{elem.tag}>"
-        
-        return result
-
     def _serialize_content(self, content: Union["DatabaseNode", list[BaseNode], BaseNode, dict, None]) -> str:
         """
         Serialize content to XML string using attribute-based format matching TypeScript.
@@ -231,125 +263,157 @@ class XmlFile(BaseFile):
         3. List of nodes - Flat table/row structure (legacy support)
         4. Single node - Single row structure
         
+        Dispatch is a single lookup on type(content) in _CONTENT_HANDLERS;
+        subclasses are resolved once by isinstance in priority order and cached.
+        
         Args:
             content: Content to serialize
             
         Returns:
             XML string with <?xml> declaration and footer comment
         """
+        handlers = _content_handlers()
+        content_type = type(content)
+        handler = handlers.get(content_type)
+        if handler is None:
+            for base, candidate in list(handlers.items()):
+                if isinstance(content, base):
+                    handler = candidate
+                    break
+            else:
+                return ""
+            handlers[content_type] = handler
+        return handler(self, content)
+
+    def _serialize_database(self, content: "DatabaseNode") -> str:
+        """Priority 1: DatabaseNode (proper semantic structure)."""
+        # Stream rows as text instead of building the jstoxml dict tree and
+        # an Element tree for the whole database
+        out = io.StringIO()
+        content.write_xml(out, indent=_XML_INDENT)
+        body = out.getvalue()
+        if not body:
+            return ""
+        return _XML_HEADER + '\n' + body + '\n' + _XML_FOOTER
+
+    def _serialize_root_node(self, content: BaseNode) -> str:
+        """Priority 1.5: Special nodes that generate root-level XML (GameEffects, VisualRemaps)."""
+        xml_elem = content.to_xml_element()
+        if not xml_elem:
+            return ""
+        
+        # GameEffectNode and VisualRemapRootNode return {_name, _attrs, _content} format
+        # We need to wrap it properly for XmlBuilder
+        # Convert to root-key format: {'GameEffects': _content}
+        root_name = str(xml_elem['_name'])
+        root_attrs = xml_elem.get('_attrs', {})
+        root_content = xml_elem.get('_content', [])
+        
+        # Build XML manually using ElementTree for these special cases
+        root = ET.Element(root_name)
+        for key, value in root_attrs.items():
+            root.set(key, str(value))
+        
+        # Add child elements
+        for child_data in root_content:
+            child_elem = self._build_element_recursive(child_data)
+            if child_elem is not None:
+                root.append(child_elem)
+        
+        # Indent and serialize in C; ET emits "<Tag />" so collapse to the
+        # compact "<Tag/>" form used everywhere else
+        ET.indent(root, space=_XML_INDENT, level=0)
+        body = ET.tostring(root, encoding='unicode', short_empty_elements=True)
+        body = body.replace(' />', '/>')
+        xml_str = (
+            _XML_HEADER + '\n'
+            + body
+            + '\n' + _XML_FOOTER
+        )
+        
+        return xml_str
+
+    def _serialize_dict(self, content: dict) -> str:
+        """Priority 2: Pre-formatted dict in jstoxml format."""
+        xml_str = XmlBuilder.build(
+            content,
+            header=True,
+            indent=_XML_INDENT,
+            footer_comment=_XML_FOOTER
+        )
+        return xml_str
+
+    def _serialize_node_list(self, content: list) -> str:
+        """Priority 3: List of nodes (legacy support - convert to DatabaseNode format)."""
+        # Convert list of nodes to jstoxml format
+        rows = []
+        for item in content:
+            if isinstance(item, BaseNode):
+                xml_elem = item.to_xml_element()
+                if xml_elem:
+                    rows.append(xml_elem)
+        
+        if not rows:
+            return ""
+        
+        # Wrap in Database structure
+        xml_dict = {
+            'Database': {
+                'Table': rows  # Array of {'_name': 'Row', '_attrs': {...}}
+            }
+        }
+        
+        xml_str = XmlBuilder.build(
+            xml_dict,
+            header=True,
+            indent=_XML_INDENT,
+            footer_comment=_XML_FOOTER
+        )
+        return xml_str
+
+    def _serialize_node(self, content: BaseNode) -> str:
+        """Priority 4: Single node."""
+        xml_elem = content.to_xml_element()
+        if not xml_elem:
+            return ""
+        
+        # Wrap in Database structure
+        xml_dict = {
+            'Database': {
+                'Table': [xml_elem]  # Single element array
+            }
+        }
+        
+        xml_str = XmlBuilder.build(
+            xml_dict,
+            header=True,
+            indent=_XML_INDENT,
+            footer_comment=_XML_FOOTER
+        )
+        return xml_str
+
+
+# Content type -> XmlFile serializer, in priority order (see _serialize_content).
+# Filled on first use to avoid importing node modules at import time.
+_CONTENT_HANDLERS: Dict[type, Callable[[XmlFile, Any], str]] = {}
+
+
+def _content_handlers() -> Dict[type, Callable[[XmlFile, Any], str]]:
+    """Return the content handler registry, building it on first use."""
+    if not _CONTENT_HANDLERS:
         # Import here to avoid circular dependency
         from civ7_modding_tools.nodes.database import DatabaseNode
         from civ7_modding_tools.nodes.nodes import GameEffectNode, VisualRemapRootNode
         
-        # Priority 1: DatabaseNode (proper semantic structure)
-        if isinstance(content, DatabaseNode):
-            xml_elem = content.to_xml_element()
-            if not xml_elem:
-                return ""
-            
-            # xml_elem is in jstoxml format: {'Database': {table1: [rows...], table2: [rows...]}}
-            xml_str = XmlBuilder.build(
-                xml_elem,
-                header=True,
-                indent='    ',
-                footer_comment='<!-- generated with https://github.com/Phlair/civ7-modding-tools -->'
-            )
-            return xml_str
-        
-        # Priority 1.5: Special nodes that generate root-level XML (GameEffects, VisualRemaps)
-        elif isinstance(content, (GameEffectNode, VisualRemapRootNode)):
-            xml_elem = content.to_xml_element()
-            if not xml_elem:
-                return ""
-            
-            # GameEffectNode and VisualRemapRootNode return {_name, _attrs, _content} format
-            # We need to wrap it properly for XmlBuilder
-            # Convert to root-key format: {'GameEffects': _content}
-            root_name = xml_elem['_name']
-            root_attrs = xml_elem.get('_attrs', {})
-            root_content = xml_elem.get('_content', [])
-            
-            # Build XML manually using ElementTree for these special cases
-            import xml.etree.ElementTree as ET
-            root = ET.Element(root_name)
-            for key, value in root_attrs.items():
-                root.set(key, str(value))
-            
-            # Add child elements
-            for child_data in root_content:
-                child_elem = self._build_element_recursive(child_data)
-                if child_elem is not None:
-                    root.append(child_elem)
-            
-            # Convert to string with custom pretty printing
-            xml_lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-            xml_lines.append(self._element_to_string(root, indent='    '))
-            xml_lines.append('<!-- generated with https://github.com/Phlair/civ7-modding-tools -->')
-            xml_str = '\n'.join(xml_lines)
-            
-            return xml_str
-        
-        # Priority 2: Pre-formatted dict in jstoxml format
-        elif isinstance(content, dict):
-            xml_str = XmlBuilder.build(
-                content,
-                header=True,
-                indent='    ',
-                footer_comment='<!-- generated with https://github.com/Phlair/civ7-modding-tools -->'
-            )
-            return xml_str
-        
-        # Priority 3: List of nodes (legacy support - convert to DatabaseNode format)
-        elif isinstance(content, list):
-            # Convert list of nodes to jstoxml format
-            rows = []
-            for item in content:
-                if isinstance(item, BaseNode):
-                    xml_elem = item.to_xml_element()
-                    if xml_elem:
-                        rows.append(xml_elem)
-            
-            if not rows:
-                return ""
-            
-            # Wrap in Database structure
-            xml_dict = {
-                'Database': {
-                    'Table': rows  # Array of {'_name': 'Row', '_attrs': {...}}
-                }
-            }
-            
-            xml_str = XmlBuilder.build(
-                xml_dict,
-                header=True,
-                indent='    ',
-                footer_comment='<!-- generated with https://github.com/Phlair/civ7-modding-tools -->'
-            )
-            return xml_str
-        
-        # Priority 4: Single node
-        elif isinstance(content, BaseNode):
-            xml_elem = content.to_xml_element()
-            if not xml_elem:
-                return ""
-            
-            # Wrap in Database structure
-            xml_dict = {
-                'Database': {
-                    'Table': [xml_elem]  # Single element array
-                }
-            }
-            
-            xml_str = XmlBuilder.build(
-                xml_dict,
-                header=True,
-                indent='    ',
-                footer_comment='<!-- generated with https://github.com/Phlair/civ7-modding-tools -->'
-            )
-            return xml_str
-        
-        else:
-            return ""
+        _CONTENT_HANDLERS.update({
+            DatabaseNode: XmlFile._serialize_database,
+            GameEffectNode: XmlFile._serialize_root_node,
+            VisualRemapRootNode: XmlFile._serialize_root_node,
+            dict: XmlFile._serialize_dict,
+            list: XmlFile._serialize_node_list,
+            BaseNode: XmlFile._serialize_node,
+        })
+    return _CONTENT_HANDLERS
 
 
 class JsFile(BaseFile):
@@ -395,16 +459,16 @@ class JsFile(BaseFile):
         if self.is_empty:
             return
         
-        # Build output directory
-        output_dir = Path(dist) / self.path.strip("/")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Build output file path
-        output_file = output_dir / self.name
+        self._write_text(dist, self.serialize())
+
+    def serialize(self) -> str:
+        """
+        Return the JavaScript source.
         
-        # Write to file
-        with open(output_file, "w", encoding="UTF-8") as f:
-            f.write(self.content)
+        Returns:
+            JavaScript source code
+        """
+        return self.content
 
 
 class ImportFile(BaseFile):
@@ -1,27 +1,126 @@
 """Localization classes for mod entities."""
 
-from typing import Optional, List
+import sys
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, NamedTuple, Optional, List, get_args, get_origin
 from pydantic import BaseModel, ConfigDict
 
+from civ7_modding_tools.utils import locale
+
+
+class LocNode(NamedTuple):
+    """A single localization entry produced by get_nodes."""
+    tag: str
+    text: str
+
+    def __getitem__(self, key: Any) -> Any:
+        """Allow dict-style node["tag"] access alongside tuple indexing."""
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+# Locale variables referenced directly by get_nodes overrides, interned once
+_DESCRIPTION = sys.intern("description")
+_CITIZEN_NAMES_MALE = sys.intern("citizenNames_male")
+_CITIZEN_NAMES_FEMALE = sys.intern("citizenNames_female")
+
+
+@lru_cache(maxsize=256)
+def _enumerated_suffix(stem: str, i: int) -> str:
+    """Return the locale variable name for the i-th entry of a list field."""
+    return f"{stem}_{i}"
+
+
+def _to_camel(name: str) -> str:
+    """Convert a snake_case field name to its camelCase locale variable."""
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def _is_list_field(annotation: Any) -> bool:
+    """Return True if a field annotation is a (possibly Optional) list."""
+    if get_origin(annotation) is list:
+        return True
+    return any(get_origin(arg) is list for arg in get_args(annotation))
+
+
+def localized(
+    rename: Optional[dict[str, str]] = None,
+    skip: tuple[str, ...] = (),
+) -> Callable[[type["BaseLocalization"]], type["BaseLocalization"]]:
+    """
+    Class decorator that derives a localization's _FIELDS from its model fields.
+    
+    Each declared field maps to its camelCase name as the locale variable
+    (full_name -> fullName), in declaration order. List fields are emitted
+    as enumerated entries (city_names -> cityNames_1, cityNames_2, ...).
+    
+    Args:
+        rename: Field name -> locale variable overrides
+        skip: Fields not emitted by the generic get_nodes
+        
+    Returns:
+        Decorator that sets _FIELDS on the class and returns it
+    """
+    rename = rename or {}
+
+    def decorate(cls: type["BaseLocalization"]) -> type["BaseLocalization"]:
+        fields = []
+        for name, field in cls.model_fields.items():
+            if name in skip:
+                continue
+            tag = rename.get(name) or _to_camel(name)
+            if _is_list_field(field.annotation):
+                tag += "_*"
+            fields.append((sys.intern(name), sys.intern(tag)))
+        cls._FIELDS = tuple(fields)
+        return cls
+
+    return decorate
+
 
 class BaseLocalization(BaseModel):
     """Base class for all localizations."""
 
     model_config = ConfigDict(extra="allow")
 
+    # (field name, locale variable) pairs emitted by get_nodes, in output order.
+    # A variable ending in "_*" marks a list field whose items are emitted as
+    # <variable>_1, <variable>_2, ... after all scalar entries. Subclasses
+    # derive it with @localized.
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+
     def __repr__(self) -> str:
         """String representation."""
         attrs = ", ".join(
             f"{k}={v!r}"
-            for k, v in self.model_dump().items()
+            for k, v in {**self.__dict__, **(self.__pydantic_extra__ or {})}.items()
+            if not k.startswith("_") and v is not None
         )
         return f"{self.__class__.__name__}({attrs})"
     
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Convert localization to node data."""
-        return []
+    def get_nodes(self, entity_id: str) -> list[LocNode]:
+        """Convert localization to node data using the class's _FIELDS table."""
+        prefix = sys.intern(entity_id.upper())
+        get = self.__dict__.get
+        
+        # Scalar fields first, then the enumerated entries of list fields
+        nodes = [
+            LocNode(locale(prefix, tag), value)
+            for attr, tag in self._FIELDS
+            if not tag.endswith("_*") and (value := get(attr))
+        ]
+        nodes += [
+            LocNode(locale(prefix, _enumerated_suffix(tag[:-2], i)), item)
+            for attr, tag in self._FIELDS
+            if tag.endswith("_*") and (items := get(attr))
+            for i, item in enumerate(items, 1)
+        ]
+        return nodes
 
 
+@localized(skip=("citizen_names",))
 class CivilizationLocalization(BaseLocalization):
     """Localization for civilizations."""
     name: Optional[str] = None
@@ -31,45 +130,29 @@ class CivilizationLocalization(BaseLocalization):
     city_names: Optional[List[str]] = None
     citizen_names: Optional[dict[str, List[str]]] = None
     
-    def get_nodes(self, entity_id: str) -> list[dict]:
+    def get_nodes(self, entity_id: str) -> list[LocNode]:
         """Generate nodes for civilization localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({
-                "tag": locale(prefix, "description"),
-                "text": self.description,
-            })
-        if self.full_name:
-            nodes.append({"tag": locale(prefix, "fullName"), "text": self.full_name})
-        if self.adjective:
-            nodes.append({"tag": locale(prefix, "adjective"), "text": self.adjective})
-        if self.city_names:
-            for i, city_name in enumerate(self.city_names, 1):
-                nodes.append({
-                    "tag": locale(prefix, f"cityNames_{i}"),
-                    "text": city_name,
-                })
+        nodes = super().get_nodes(entity_id)
         if self.citizen_names:
+            prefix = sys.intern(entity_id.upper())
             male_names = self.citizen_names.get('male', [])
             female_names = self.citizen_names.get('female', [])
-            for i, male_name in enumerate(male_names, 1):
-                nodes.append({
-                    "tag": locale(prefix, f"citizenNames_male_{i}"),
-                    "text": male_name,
-                })
-            for i, female_name in enumerate(female_names, 1):
-                nodes.append({
-                    "tag": locale(prefix, f"citizenNames_female_{i}"),
-                    "text": female_name,
-                })
+            # Sized lists (not generators) so each extend grows nodes once
+            nodes += [
+                LocNode(locale(prefix, _enumerated_suffix(_CITIZEN_NAMES_MALE, i)), male_name)
+                for i, male_name in enumerate(male_names, 1)
+            ]
+            nodes += [
+                LocNode(locale(prefix, _enumerated_suffix(_CITIZEN_NAMES_FEMALE, i)), female_name)
+                for i, female_name in enumerate(female_names, 1)
+            ]
         return nodes
 
 
+@localized(
+    rename={"historical_description": "historicalContext"},
+    skip=("summary_description",),
+)
 class UnitLocalization(BaseLocalization):
     """Localization for units."""
     name: Optional[str] = None
@@ -77,138 +160,53 @@ class UnitLocalization(BaseLocalization):
     summary_description: Optional[str] = None
     historical_description: Optional[str] = None
     unique_name: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for unit localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        if self.historical_description:
-            nodes.append({"tag": locale(prefix, "historicalContext"), "text": self.historical_description})
-        if self.unique_name:
-            nodes.append({"tag": locale(prefix, "uniqueName"), "text": self.unique_name})
-        return nodes
 
 
+@localized()
 class ConstructibleLocalization(BaseLocalization):
     """Localization for buildings and improvements."""
     name: Optional[str] = None
     description: Optional[str] = None
     unique_name: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for constructible localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        if self.unique_name:
-            nodes.append({"tag": locale(prefix, "uniqueName"), "text": self.unique_name})
-        return nodes
 
 
+@localized()
 class ProgressionTreeLocalization(BaseLocalization):
     """Localization for progression trees."""
     name: Optional[str] = None
     description: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for progression tree localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        return nodes
 
 
+@localized()
 class ProgressionTreeNodeLocalization(BaseLocalization):
     """Localization for progression tree nodes."""
     name: Optional[str] = None
     description: Optional[str] = None
     quote: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for progression tree node localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        if self.quote:
-            nodes.append({"tag": locale(prefix, "quote"), "text": self.quote})
-        return nodes
 
 
+@localized()
 class ModifierLocalization(BaseLocalization):
     """Localization for modifiers."""
     name: Optional[str] = None
     description: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for modifier localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        return nodes
 
 
+@localized()
 class TraditionLocalization(BaseLocalization):
     """Localization for traditions."""
     name: Optional[str] = None
     description: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for tradition localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        return nodes
 
 
+@localized(rename={"leader_name": "name"})
 class LeaderUnlockLocalization(BaseLocalization):
     """Localization for leader unlocks."""
     leader_name: Optional[str] = None
     description: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for leader unlock localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.leader_name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.leader_name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        return nodes
 
 
+@localized(skip=("civilization_name",))
 class CivilizationUnlockLocalization(BaseLocalization):
     """Localization for civilization unlocks.
     
@@ -221,59 +219,31 @@ class CivilizationUnlockLocalization(BaseLocalization):
     description: Optional[str] = None
     custom_description: Optional[str] = None
     
-    def get_nodes(self, entity_id: str) -> list[dict]:
+    def get_nodes(self, entity_id: str) -> list[LocNode]:
         """Generate nodes for civilization unlock localization.
         
         Auto-generates 'description' if not explicitly provided.
         custom_description is output as a separate entry for civ-to-civ
         tooltips (e.g., LOC_UNLOCK_PLAY_AS_CARTHAGE_SPAIN_TOOLTIP).
         """
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
+        nodes = super().get_nodes(entity_id)
         
-        # Auto-generate description if not explicitly provided
-        if self.description:
-            # Explicit description takes precedence
-            nodes.append(
-                {"tag": locale(prefix, "description"), "text": self.description}
-            )
-        elif self.civilization_name:
-            # Auto-generate: "Play as [B]{CivName}[/B]."
+        # Auto-generate: "Play as [B]{CivName}[/B]." after the name entry
+        if not self.description and self.civilization_name:
             auto_desc = f"Play as [B]{self.civilization_name}[/B]."
-            nodes.append(
-                {"tag": locale(prefix, "description"), "text": auto_desc}
-            )
-        
-        # Custom description for civ-to-civ tooltips
-        if self.custom_description:
-            nodes.append(
-                {"tag": locale(prefix, "customDescription"), 
-                 "text": self.custom_description}
+            nodes.insert(
+                1 if self.name else 0,
+                LocNode(locale(sys.intern(entity_id.upper()), _DESCRIPTION), auto_desc),
             )
         
         return nodes
 
 
+@localized()
 class UniqueQuarterLocalization(BaseLocalization):
     """Localization for unique quarters."""
     name: Optional[str] = None
     description: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for unique quarter localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        return nodes
 
 
 class ModuleLocalization(BaseLocalization):
@@ -282,43 +252,34 @@ class ModuleLocalization(BaseLocalization):
     description: Optional[str] = None
     authors: Optional[str] = None
     
-    def get_nodes(self, entity_id: str) -> list[dict]:
+    def get_nodes(self, entity_id: str) -> list[LocNode]:
         """Generate nodes for module localization."""
         nodes = []
         
         # entity_id should be the LOC key prefix, e.g., "LOC_MODULE_BABYLON"
         if self.name:
-            nodes.append({"tag": f"{entity_id}_NAME", "text": self.name})
+            nodes.append(LocNode(sys.intern(f"{entity_id}_NAME"), self.name))
         if self.description:
-            nodes.append({"tag": f"{entity_id}_DESCRIPTION", "text": self.description})
+            nodes.append(LocNode(sys.intern(f"{entity_id}_DESCRIPTION"), self.description))
         if self.authors:
             # Generate LOC_AUTHORS_[MOD] key
             authors_key = entity_id.replace("LOC_MODULE_", "LOC_AUTHORS_")
-            nodes.append({"tag": authors_key, "text": self.authors})
+            nodes.append(LocNode(sys.intern(authors_key), self.authors))
         
         return nodes
 
 
+@localized()
 class NamedPlaceLocalization(BaseLocalization):
     """Localization for named places."""
     name: Optional[str] = None
     description: Optional[str] = None
-    
-    def get_nodes(self, entity_id: str) -> list[dict]:
-        """Generate nodes for named place localization."""
-        from civ7_modding_tools.utils import locale
-        nodes = []
-        prefix = entity_id.upper()
-        
-        if self.name:
-            nodes.append({"tag": locale(prefix, "name"), "text": self.name})
-        if self.description:
-            nodes.append({"tag": locale(prefix, "description"), "text": self.description})
-        return nodes
 
 
 __all__ = [
     "BaseLocalization",
+    "LocNode",
+    "localized",
     "CivilizationLocalization",
     "UnitLocalization",
     "ConstructibleLocalization",
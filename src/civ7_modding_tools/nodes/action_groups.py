@@ -1,8 +1,14 @@
 """Criteria and ActionGroup nodes for mod loading control."""
 
-from typing import Optional
-from uuid import uuid4
+from typing import Any, Optional
+from pydantic import Field
 from civ7_modding_tools.nodes.base import BaseNode
+from civ7_modding_tools.utils import uuid4_str
+
+
+def _age_entry(age: str) -> dict[str, Any]:
+    """Build a single AgeInUse entry for a criteria age."""
+    return {"_attrs": {"type": age}}
 
 
 class CriteriaNode(BaseNode):
@@ -13,21 +19,23 @@ class CriteriaNode(BaseNode):
     typically based on game ages (Antiquity, Medieval, Modern, etc).
     """
     
-    _name: str = "Criteria"
+    _name = "Criteria"
     
     id: Optional[str] = None
     any: Optional[bool] = None
-    ages: list[str] = []
+    ages: list[str] = Field(default_factory=list)
     
-    def __init__(self, payload: dict | None = None) -> None:
+    def __init__(self, payload: dict[str, Any] | None = None) -> None:
         """Initialize CriteriaNode with optional payload."""
         super().__init__()
-        if self.id is None:
-            self.id = str(uuid4())
+        payload = payload or {}
+        # Only generate an id when the payload won't overwrite it
+        if self.id is None and "id" not in payload:
+            self.id = uuid4_str()
         if payload:
-            self.fill(payload)
+            self.fill(payload, validate=False)
     
-    def to_xml_element(self) -> dict:
+    def to_xml_element(self) -> dict[str, Any]:
         """
         Generate Criteria XML element.
         
@@ -39,9 +47,9 @@ class CriteriaNode(BaseNode):
             attrs["any"] = "true"
         
         # Create content - ages if present, otherwise AlwaysMet
-        content = {}
+        content: dict[str, tuple[dict[str, Any], ...] | None]
         if self.ages:
-            content = {"AgeInUse": [{"_attrs": {"type": age}} for age in self.ages]}
+            content = {"AgeInUse": tuple(map(_age_entry, self.ages))}
         else:
             content = {"AlwaysMet": None}
         
@@ -61,25 +69,28 @@ class ActionGroupNode(BaseNode):
     and associated criteria.
     """
     
-    _name: str = "ActionGroup"
+    _name = "ActionGroup"
     
     id: Optional[str] = None
     scope: Optional[str] = None  # "game" or "shell"
     criteria: Optional[CriteriaNode] = None
     
-    def __init__(self, payload: dict | None = None) -> None:
+    def __init__(self, payload: dict[str, Any] | None = None) -> None:
         """Initialize ActionGroupNode with optional payload."""
         super().__init__()
-        if self.id is None:
-            self.id = str(uuid4())
+        payload = payload or {}
+        # Skip generating defaults (a uuid, a whole CriteriaNode) that the
+        # payload is about to overwrite
+        if self.id is None and "id" not in payload:
+            self.id = uuid4_str()
         if self.scope is None:
             self.scope = "game"
-        if self.criteria is None:
+        if self.criteria is None and "criteria" not in payload:
             self.criteria = CriteriaNode()
         if payload:
-            self.fill(payload)
+            self.fill(payload, validate=False)
     
-    def to_xml_element(self) -> dict:
+    def to_xml_element(self) -> dict[str, Any]:
         """
         Generate ActionGroup XML element.
         
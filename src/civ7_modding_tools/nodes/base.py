@@ -1,8 +1,150 @@
 """Base node class for XML element representation."""
 
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, ConfigDict, PrivateAttr
+import sys
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, NamedTuple, Optional, TextIO, Union, get_args, get_origin
+from types import UnionType
+from pydantic import BaseModel, ConfigDict
 from civ7_modding_tools.utils import camel_to_pascal
+from civ7_modding_tools.xml_builder import XmlBuilder, XmlElement, XmlRow
+
+_TRUE = "true"
+_FALSE = "false"
+
+# Direct tuple construction for XmlRow results
+_new_row = tuple.__new__
+
+# Default element name shared by every plain table row
+_ROW = sys.intern("Row")
+
+# Shared string forms of the small integers that recur across rows
+# (amounts, tiers, priorities), filled lazily up to _INT_CACHE_MAX
+_INT_CACHE_MAX = 1024
+_INT_STRINGS: Dict[int, str] = {}
+
+
+def _write_any(value: Any) -> Optional[str]:
+    """
+    Stringify an attribute value, or return None if it should be omitted.
+    
+    None and empty strings are omitted, bools become "true"/"false", and
+    everything else is stringified (reusing shared strings for small ints).
+    
+    Args:
+        value: Attribute value
+        
+    Returns:
+        XML attribute text, or None to skip the attribute
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value or None
+    if value is None:
+        return None
+    if value_type is bool:
+        return _TRUE if value else _FALSE
+    if value_type is int and -_INT_CACHE_MAX <= value <= _INT_CACHE_MAX:
+        text = _INT_STRINGS.get(value)
+        if text is None:
+            text = _INT_STRINGS.setdefault(value, str(value))
+        return text
+    if value == "":
+        return None
+    return str(value)
+
+
+def _write_str(value: Any) -> Optional[str]:
+    """Writer for str-annotated fields; other value types fall back to _write_any."""
+    if type(value) is str:
+        return value or None
+    return None if value is None else _write_any(value)
+
+
+def _write_enum(value: Any) -> Optional[str]:
+    """Writer for enumerated str fields (types, kinds, ids): interns the value."""
+    if type(value) is str:
+        return sys.intern(value) if value else None
+    return None if value is None else _write_any(value)
+
+
+def _write_bool(value: Any) -> Optional[str]:
+    """Writer for bool-annotated fields; other value types fall back to _write_any."""
+    if value is True:
+        return _TRUE
+    if value is False:
+        return _FALSE
+    return None if value is None else _write_any(value)
+
+
+# Writers specialized by the (non-None) type a field is annotated with
+_WRITERS_BY_TYPE: Dict[type, Callable[[Any], Optional[str]]] = {
+    str: _write_str,
+    bool: _write_bool,
+}
+
+
+# Str fields holding game identifiers rather than free text; their values
+# repeat across many rows, so they are interned when serialized
+_ENUM_FIELD_NAMES = frozenset({"type", "type_", "kind", "tag", "age"})
+_ENUM_FIELD_SUFFIXES = ("_type", "_id")
+
+
+def _field_writer(name: str, annotation: Any) -> Callable[[Any], Optional[str]]:
+    """
+    Pick the attribute writer for a field.
+    
+    Optional[X] / X | None is unwrapped to X; anything without a specialized
+    writer uses the generic _write_any. Str fields named like identifiers
+    (type_, kind, *_type, *_id) get the interning _write_enum.
+    
+    Args:
+        name: Field name
+        annotation: Field annotation from model_fields
+        
+    Returns:
+        Function mapping a field value to its XML text (or None to omit it)
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    write = _WRITERS_BY_TYPE.get(annotation, _write_any)
+    if write is _write_str and (
+        name in _ENUM_FIELD_NAMES or name.endswith(_ENUM_FIELD_SUFFIXES)
+    ):
+        return _write_enum
+    return write
+
+
+class FieldSpec(NamedTuple):
+    """Serialization spec for one declared node field."""
+    py: str
+    xml: str
+    write: Callable[[Any], Optional[str]]
+
+
+@lru_cache(maxsize=1024)
+def _xml_key(key: str) -> str:
+    """
+    Convert a property name to its XML attribute name.
+    
+    snake_case names become PascalCase (a trailing underscore as in 'type_'
+    is dropped); camelCase or single-word names only get their first letter
+    capitalized. This matches TypeScript lodash.startCase behavior.
+    
+    Memoized so extra (undeclared) attributes, which bypass the per-class
+    _FIELDS table, only pay for the conversion once per name. Results are
+    interned: they key the _attrs dict of every emitted row.
+    
+    Args:
+        key: Property name
+        
+    Returns:
+        XML attribute name
+    """
+    if "_" in key:
+        return sys.intern("".join(p.capitalize() for p in key.split("_") if p))
+    return sys.intern(camel_to_pascal(key))
 
 
 class BaseNode(BaseModel):
@@ -13,90 +155,173 @@ class BaseNode(BaseModel):
     Properties are automatically converted to XML attributes via camelCase -> PascalCase.
     """
 
-    model_config = ConfigDict(extra="allow")
+    # defer_build: the ~100 node classes build their validators on first
+    # instantiation instead of at import, so unused node types cost nothing.
+    # extra="allow" is required: rows carry undeclared columns (start-bias
+    # terrains, requirement arguments, ...). Pydantic keeps declared fields
+    # in the instance __dict__, so nodes can't be slotted either.
+    model_config = ConfigDict(extra="allow", defer_build=True)
     
-    # Private attributes (not included in model_dump)
-    _name: str = PrivateAttr(default="Row")
+    # XML element name. A class-level constant rather than a PrivateAttr, so
+    # instances carry no private-attribute state to initialize on every
+    # construction. Subclasses override it unannotated: `_name = "Criteria"`
+    _name: ClassVar[str] = _ROW
+
+    # Declared fields with their XML attribute name and the writer chosen
+    # from the annotated type, precomputed once per subclass
+    _FIELDS: ClassVar[tuple[FieldSpec, ...]] = ()
+
+    # Declared field names, so fill() can test membership without going
+    # through pydantic's model_fields property on every call
+    _field_keys: ClassVar[frozenset[str]] = frozenset()
+
+    # Names defined on the class or its bases (methods, properties, ...),
+    # which fill() must not shadow with extras
+    _class_attrs: ClassVar[frozenset[str]] = frozenset()
+
+    # Identifier-like str fields (see _field_writer) whose values fill()
+    # interns as they come in
+    _enum_fields: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute XML attribute names for the subclass's declared fields."""
+        super().__pydantic_init_subclass__(**kwargs)
+        # An annotated `_name: str = ...` override becomes a pydantic private
+        # attribute, which the inherited class-level name would shadow; a bare
+        # `_name: str` annotation keeps the inherited name
+        private_name = cls.__private_attributes__.get("_name")
+        if private_name is not None and isinstance(private_name.default, str):
+            type.__setattr__(cls, "_name", sys.intern(private_name.default))
+        cls._FIELDS = tuple(
+            FieldSpec(key, _xml_key(key), _field_writer(key, field.annotation))
+            for key, field in cls.model_fields.items()
+        )
+        cls._field_keys = frozenset(spec.py for spec in cls._FIELDS)
+        cls._enum_fields = frozenset(
+            spec.py for spec in cls._FIELDS if spec.write is _write_enum
+        )
+        cls._class_attrs = frozenset(
+            name for klass in cls.__mro__ for name in vars(klass)
+        )
 
-    def fill(self, payload: Dict[str, Any]) -> "BaseNode":
+    def fill(self, payload: Dict[str, Any], *, validate: bool = True) -> "BaseNode":
         """
         Fill node properties from a dictionary payload.
         
-        Uses pydantic's model_validate to safely set properties.
+        Uses pydantic's model_validate to safely set properties. String
+        values of identifier-like fields (type_, kind, *_type, ...) are
+        interned, so rows sharing a game type share one string object.
         
         Args:
             payload: Dictionary of properties to set
+            validate: When False, declared fields and extras are written
+                straight into the instance storage, bypassing pydantic's
+                __setattr__ hook. Only use this with trusted, already-typed
+                payloads.
             
         Returns:
             Self for fluent API chaining
         """
+        cls = type(self)
+        enum_fields = cls._enum_fields
+        if validate:
+            for key, value in payload.items():
+                if key in enum_fields and type(value) is str:
+                    value = sys.intern(value)
+                setattr(self, key, value)
+            return self
+        
+        fields = cls._field_keys
+        d = self.__dict__
+        extra = self.__pydantic_extra__
+        fields_set = self.__pydantic_fields_set__
         for key, value in payload.items():
-            setattr(self, key, value)
+            if key in fields:
+                if key in enum_fields and type(value) is str:
+                    value = sys.intern(value)
+                d[key] = value
+                fields_set.add(key)
+            elif (
+                extra is not None
+                and not key.startswith("_")
+                and key not in cls._class_attrs
+            ):
+                # New extra attribute: pydantic can't memoize a setattr handler
+                # for free-form names, so store it the way it would directly
+                extra[key] = value
+                fields_set.add(key)
+            else:
+                # Private attributes and class-level names go through pydantic
+                setattr(self, key, value)
         return self
 
 
 
-    def to_xml_element(self) -> Optional[Dict[str, Any]]:
+    def to_xml_element(self) -> Optional[XmlElement]:
         """
-        Convert this node to an XML element dictionary compatible with jstoxml format.
+        Convert this node to an XML element row compatible with jstoxml format.
         
         Properties are serialized as XML attributes with the following rules:
         - Properties starting with '_' are excluded
         - snake_case properties are converted to PascalCase
-        - None, empty string, and False values are omitted
-        - Boolean True converted to "true", False is omitted
+        - None and empty string values are omitted
+        - Booleans are converted to "true"/"false"
         - All other values are stringified
         
         Returns:
-            Dictionary with _name and _attrs keys matching TypeScript jstoxml format,
-            or None if node is empty
+            XmlRow of element name and attributes (also readable as
+            row['_name'] / row['_attrs'] like a jstoxml dict), or None if
+            node is empty
             
         Example:
-            {'_name': 'Row', '_attrs': {'Type': 'VALUE', 'Kind': 'KIND_TYPE'}}
+            XmlRow(name='Row', attrs={'Type': 'VALUE', 'Kind': 'KIND_TYPE'})
         """
         attributes: Dict[str, str] = {}
         
-        # Get all model fields, excluding those marked as exclude=True
-        model_data = self.model_dump(exclude_none=False, exclude_unset=False)
+        # Declared fields: read straight from __dict__ (no model_dump() copy)
+        # using each field's precomputed XML name and typed writer
+        d = self.__dict__
+        for py, xml, write in self._FIELDS:
+            value = d.get(py)
+            if value is not None:
+                text = write(value)
+                if text is not None:
+                    attributes[xml] = text
         
-        for key, value in model_data.items():
-            # Skip private properties (those starting with '_')
-            if key.startswith("_"):
-                continue
-            
-            # Skip None and empty string values
-            if value is None or value == "":
-                continue
-            
-            # Convert boolean values to strings ("true" or "false")
-            if isinstance(value, bool):
-                value = "true" if value else "false"
-            
-            # Convert property name from snake_case to PascalCase
-            # This matches TypeScript lodash.startCase behavior
-            if "_" in key:
-                # Split by underscore and capitalize each part
-                parts = key.split("_")
-                # PascalCase: capitalize each part (but skip empty trailing parts from trailing underscore)
-                # Handle special case: 'type_' becomes 'Type' not 'Type' + empty
-                xml_key = "".join(p.capitalize() for p in parts if p)
-            else:
-                # Already camelCase or single word - just capitalize first letter
-                xml_key = key[0].upper() + key[1:] if key else key
-            
-            # Stringify all values
-            attributes[xml_key] = str(value)
+        # Extra (undeclared) attributes convert on demand
+        if self.__pydantic_extra__:
+            for key, value in self.__pydantic_extra__.items():
+                # Skip private properties (those starting with '_')
+                if key.startswith("_"):
+                    continue
+                text = _write_any(value)
+                if text is not None:
+                    attributes[_xml_key(key)] = text
         
         # Return None if no attributes (empty node)
         if not attributes:
             return None
         
-        # Return in jstoxml-compatible format
-        # This matches TypeScript: {_name: this._name, _attrs: this.getAttributes()}
-        return {
-            '_name': self._name,
-            '_attrs': attributes
-        }
+        # Tuple row rather than a {'_name': ..., '_attrs': ...} dict, built
+        # without the NamedTuple constructor's argument handling
+        return _new_row(XmlRow, (self._name, attributes, None))
+
+    def write_xml(self, out: TextIO, indent: str = "    ", level: int = 0) -> None:
+        """
+        Write this node's XML element to a text stream.
+        
+        Writes the same text XmlBuilder produces for to_xml_element(), without
+        building an Element tree; nothing is written for an empty node.
+        
+        Args:
+            out: Text stream (file or io.StringIO) to write to
+            indent: Indentation string
+            level: Indentation level of the element
+        """
+        row = self.to_xml_element()
+        if row is not None:
+            XmlBuilder.write_row(out, row, indent, level)
 
     def __repr__(self) -> str:
         """String representation of the node."""
@@ -106,3 +331,8 @@ class BaseNode(BaseModel):
             if not k.startswith("_")
         )
         return f"{self.__class__.__name__}({attrs})"
+
+
+BaseNode._class_attrs = frozenset(
+    name for klass in BaseNode.__mro__ for name in vars(klass)
+)
@@ -1,7 +1,13 @@
 """DatabaseNode and supporting node types for complete mod database structure."""
 
-from typing import Optional
+import sys
+from functools import cache
+from types import MappingProxyType
+from typing import Iterator, Optional, TextIO, get_origin
+from pydantic import Field
 from civ7_modding_tools.nodes.base import BaseNode
+from civ7_modding_tools.nodes.nodes import CivilizationTraitNode
+from civ7_modding_tools.xml_builder import XmlBuilder, XmlElement, XmlRow
 
 
 # ============================================================================
@@ -10,21 +16,21 @@ from civ7_modding_tools.nodes.base import BaseNode
 
 class KindNode(BaseNode):
     """Represents a Kind definition (category/classification)."""
-    _name: str = "InsertOrIgnore"
+    _name = "InsertOrIgnore"
     kind: Optional[str] = None
     
-    def to_xml_element(self) -> dict | None:
+    def to_xml_element(self) -> XmlElement | None:
         """Override to use KIND (all caps) instead of Kind."""
         result = super().to_xml_element()
-        if result and '_attrs' in result and 'Kind' in result['_attrs']:
+        if isinstance(result, XmlRow) and 'Kind' in result.attrs:
             # Rename Kind to KIND (all uppercase)
-            result['_attrs']['KIND'] = result['_attrs'].pop('Kind')
+            result.attrs['KIND'] = result.attrs.pop('Kind')
         return result
 
 
 class TypeNode(BaseNode):
     """Represents a Type definition."""
-    _name: str = "Row"
+    _name = "Row"
     # Using 'type_' to avoid conflict with Python built-in 'type'
     # Will be serialized as 'Type' in XML
     type_: Optional[str] = None
@@ -33,7 +39,7 @@ class TypeNode(BaseNode):
 
 class TagNode(BaseNode):
     """Represents a Tag definition."""
-    _name: str = "Row"
+    _name = "Row"
     tag: Optional[str] = None
     tag_string: Optional[str] = None
     category: Optional[str] = None
@@ -41,7 +47,7 @@ class TagNode(BaseNode):
 
 class TypeTagNode(BaseNode):
     """Represents a Type-Tag relationship."""
-    _name: str = "Row"
+    _name = "Row"
     type_: Optional[str] = None
     tag: Optional[str] = None
     category: Optional[str] = None
@@ -53,7 +59,7 @@ class TypeTagNode(BaseNode):
 
 class TraitNode(BaseNode):
     """Represents a Trait definition."""
-    _name: str = "Row"
+    _name = "Row"
     trait_type: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
@@ -62,7 +68,7 @@ class TraitNode(BaseNode):
 
 class TraitModifierNode(BaseNode):
     """Represents a Trait-Modifier relationship."""
-    _name: str = "Row"
+    _name = "Row"
     trait_type: Optional[str] = None
     modifier_id: Optional[str] = None
 
@@ -73,7 +79,7 @@ class TraitModifierNode(BaseNode):
 
 class CivilizationItemNode(BaseNode):
     """Represents a Civilization item (unit/building reference)."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_domain: Optional[str] = None
     civilization_type: Optional[str] = None
     type: Optional[str] = None
@@ -85,7 +91,7 @@ class CivilizationItemNode(BaseNode):
 
 class CivilizationTagNode(BaseNode):
     """Represents a Civilization-Tag relationship."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_domain: Optional[str] = None
     civilization_type: Optional[str] = None
     tag: Optional[str] = None
@@ -97,7 +103,7 @@ class CivilizationTagNode(BaseNode):
 
 class BuildingNode(BaseNode):
     """Represents a Building definition."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     movable: Optional[bool] = None
     trait_type: Optional[str] = None
@@ -108,7 +114,7 @@ class BuildingNode(BaseNode):
 
 class ImprovementNode(BaseNode):
     """Represents an Improvement definition."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     trait_type: Optional[str] = None
     city_buildable: Optional[bool] = None
@@ -125,44 +131,40 @@ class ImprovementNode(BaseNode):
 # CONSTRUCTIBLE CONSTRAINT NODES
 # ============================================================================
 
-class ConstructibleValidDistrictNode(BaseNode):
-    """Represents constructible-district validity constraint."""
-    _name: str = "Row"
+class _ConstructibleValidNode(BaseNode):
+    """Shared base for Constructible_Valid* rows: a constructible plus one constraint column."""
+    _name = "Row"
     constructible_type: Optional[str] = None
+
+
+class ConstructibleValidDistrictNode(_ConstructibleValidNode):
+    """Represents constructible-district validity constraint."""
     district_type: Optional[str] = None
 
 
-class ConstructibleValidBiomeNode(BaseNode):
+class ConstructibleValidBiomeNode(_ConstructibleValidNode):
     """Represents constructible-biome validity constraint."""
-    _name: str = "Row"
-    constructible_type: Optional[str] = None
     biome_type: Optional[str] = None
 
 
-class ConstructibleValidFeatureNode(BaseNode):
+class ConstructibleValidFeatureNode(_ConstructibleValidNode):
     """Represents constructible-feature validity constraint."""
-    _name: str = "Row"
-    constructible_type: Optional[str] = None
     feature_type: Optional[str] = None
 
 
-class ConstructibleValidTerrainNode(BaseNode):
+class ConstructibleValidTerrainNode(_ConstructibleValidNode):
     """Represents constructible-terrain validity constraint."""
-    _name: str = "Row"
-    constructible_type: Optional[str] = None
     terrain_type: Optional[str] = None
 
 
-class ConstructibleValidResourceNode(BaseNode):
+class ConstructibleValidResourceNode(_ConstructibleValidNode):
     """Represents constructible-resource validity constraint."""
-    _name: str = "Row"
-    constructible_type: Optional[str] = None
     resource_type: Optional[str] = None
 
 
 class ConstructibleMaintenanceNode(BaseNode):
     """Represents building maintenance requirements."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     yield_type: Optional[str] = None
     amount: Optional[int] = None
@@ -170,7 +172,7 @@ class ConstructibleMaintenanceNode(BaseNode):
 
 class ConstructiblePlunderNode(BaseNode):
     """Represents plunder from constructible."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     plunder_type: Optional[str] = None
     amount: Optional[int] = None
@@ -178,21 +180,21 @@ class ConstructiblePlunderNode(BaseNode):
 
 class ConstructibleModifierNode(BaseNode):
     """Represents constructible-modifier linkage."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     modifier_id: Optional[str] = None
 
 
 class ConstructibleBuildingCostProgressionNode(BaseNode):
     """Represents building cost progression."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     percent: Optional[int] = None
 
 
 class ConstructibleAdvisoryNode(BaseNode):
     """Represents constructible advisory classification."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     advisory_class_type: Optional[str] = None
 
@@ -203,7 +205,7 @@ class ConstructibleAdvisoryNode(BaseNode):
 
 class ConstructibleAdjacencyNode(BaseNode):
     """Represents adjacency yield constraints for constructible."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     yield_change_id: Optional[str] = None
     requires_activation: Optional[bool] = None
@@ -211,7 +213,7 @@ class ConstructibleAdjacencyNode(BaseNode):
 
 class AdjacencyYieldChangeNode(BaseNode):
     """Represents adjacency yield change definition."""
-    _name: str = "Row"
+    _name = "Row"
     id: Optional[str] = None
     age: Optional[str] = None
     yield_type: Optional[str] = None
@@ -230,7 +232,7 @@ class AdjacencyYieldChangeNode(BaseNode):
 
 class WarehouseYieldChangeNode(BaseNode):
     """Represents warehouse-based yield changes."""
-    _name: str = "Row"
+    _name = "Row"
     warehouse_type: Optional[str] = None
     yield_type: Optional[str] = None
     amount: Optional[int] = None
@@ -238,7 +240,7 @@ class WarehouseYieldChangeNode(BaseNode):
 
 class ConstructibleWarehouseYieldNode(BaseNode):
     """Represents constructible-warehouse yield relationship."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     warehouse_type: Optional[str] = None
 
@@ -249,30 +251,30 @@ class ConstructibleWarehouseYieldNode(BaseNode):
 
 class UnlockNode(BaseNode):
     """Represents an Unlock configuration."""
-    _name: str = "Row"
+    _name = "Row"
     unlock_id: Optional[str] = None
     unlock_era: Optional[str] = None
 
 
-class UnlockRewardNode(BaseNode):
-    """Represents a reward from an unlock."""
-    _name: str = "Row"
+class _UnlockRowNode(BaseNode):
+    """Shared base for Unlock_* rows keyed by unlock_id."""
+    _name = "Row"
     unlock_id: Optional[str] = None
+
+
+class UnlockRewardNode(_UnlockRowNode):
+    """Represents a reward from an unlock."""
     reward_type: Optional[str] = None
     reward_value: Optional[str] = None
 
 
-class UnlockRequirementNode(BaseNode):
+class UnlockRequirementNode(_UnlockRowNode):
     """Represents a requirement for an unlock."""
-    _name: str = "Row"
-    unlock_id: Optional[str] = None
     requirement_set_id: Optional[str] = None
 
 
-class UnlockConfigurationValueNode(BaseNode):
+class UnlockConfigurationValueNode(_UnlockRowNode):
     """Represents unlock configuration value."""
-    _name: str = "Row"
-    unlock_id: Optional[str] = None
     config_key: Optional[str] = None
     config_value: Optional[str] = None
 
@@ -283,14 +285,14 @@ class UnlockConfigurationValueNode(BaseNode):
 
 class RequirementSetNode(BaseNode):
     """Represents a RequirementSet."""
-    _name: str = "Row"
+    _name = "Row"
     requirement_set_id: Optional[str] = None
     requirement_set_type: Optional[str] = None
 
 
 class RequirementNode(BaseNode):
     """Represents a Requirement."""
-    _name: str = "Row"
+    _name = "Row"
     requirement_id: Optional[str] = None
     requirement_type: Optional[str] = None
     inverse: Optional[bool] = None
@@ -298,7 +300,7 @@ class RequirementNode(BaseNode):
 
 class RequirementArgumentNode(BaseNode):
     """Represents a Requirement argument."""
-    _name: str = "Row"
+    _name = "Row"
     requirement_id: Optional[str] = None
     argument_name: Optional[str] = None
     argument_value: Optional[str] = None
@@ -306,7 +308,7 @@ class RequirementArgumentNode(BaseNode):
 
 class RequirementSetRequirementNode(BaseNode):
     """Represents a Requirement in a RequirementSet."""
-    _name: str = "Row"
+    _name = "Row"
     requirement_set_id: Optional[str] = None
     requirement_id: Optional[str] = None
 
@@ -317,7 +319,7 @@ class RequirementSetRequirementNode(BaseNode):
 
 class ModifierNode(BaseNode):
     """Represents a Modifier."""
-    _name: str = "Row"
+    _name = "Row"
     modifier_id: Optional[str] = None
     modifier_type: Optional[str] = None
     owner_type: Optional[str] = None
@@ -326,13 +328,13 @@ class ModifierNode(BaseNode):
 
 class GameModifierNode(BaseNode):
     """Represents a game-wide modifier."""
-    _name: str = "Row"
+    _name = "Row"
     modifier_id: Optional[str] = None
 
 
 class ModifierStringNode(BaseNode):
     """Represents a modifier preview string for UI display."""
-    _name: str = "Row"
+    _name = "Row"
     modifier_id: Optional[str] = None
     context: Optional[str] = None
     text: Optional[str] = None
@@ -340,7 +342,7 @@ class ModifierStringNode(BaseNode):
 
 class ArgumentNode(BaseNode):
     """Represents a modifier/effect argument."""
-    _name: str = "Row"
+    _name = "Row"
     modifier_id: Optional[str] = None
     argument_name: Optional[str] = None
     argument_value: Optional[str] = None
@@ -352,14 +354,14 @@ class ArgumentNode(BaseNode):
 
 class ProgressionTreeAdvisoryNode(BaseNode):
     """Represents progression tree advisory."""
-    _name: str = "Row"
+    _name = "Row"
     progression_tree_node_type: Optional[str] = None
     advisory_class_type: Optional[str] = None
 
 
 class ProgressionTreeNodeUnlockNode(BaseNode):
     """Represents unlock in progression tree node."""
-    _name: str = "Row"
+    _name = "Row"
     progression_tree_node_type: Optional[str] = None
     target_kind: Optional[str] = None
     target_type: Optional[str] = None
@@ -371,7 +373,7 @@ class ProgressionTreeNodeUnlockNode(BaseNode):
 
 class ProgressionTreeQuoteNode(BaseNode):
     """Represents a narrative quote in progression tree."""
-    _name: str = "Row"
+    _name = "Row"
     progression_tree_type: Optional[str] = None
     quote_type: Optional[str] = None
     text: Optional[str] = None
@@ -379,7 +381,7 @@ class ProgressionTreeQuoteNode(BaseNode):
 
 class TypeQuoteNode(BaseNode):
     """Represents a quote in TypeQuotes table (for progression tree nodes)."""
-    _name: str = "Row"
+    _name = "Row"
     type: Optional[str] = None  # Node type (e.g., NODE_CIVIC_AQ_ROME_...)
     quote: Optional[str] = None  # LOC key for quote text
     quote_author: Optional[str] = None  # LOC key for quote author
@@ -392,7 +394,7 @@ class TypeQuoteNode(BaseNode):
 
 class TraditionModifierNode(BaseNode):
     """Represents a Tradition-Modifier relationship."""
-    _name: str = "Row"
+    _name = "Row"
     tradition_type: Optional[str] = None
     modifier_id: Optional[str] = None
 
@@ -403,7 +405,7 @@ class TraditionModifierNode(BaseNode):
 
 class UnitAbilityNode(BaseNode):
     """Represents a unit ability definition."""
-    _name: str = "Row"
+    _name = "Row"
     unit_ability_type: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
@@ -414,22 +416,22 @@ class UnitAbilityNode(BaseNode):
 
 class UnitClassAbilityNode(BaseNode):
     """Represents Unit Class-Ability relationship (junction table)."""
-    _name: str = "Row"
-    _container_name: str = "UnitClass_Abilities"
+    _name = "Row"
+    _container_name = "UnitClass_Abilities"
     unit_ability_type: Optional[str] = None
     unit_class_type: Optional[str] = None
 
 
 class UnitAbilityModifierNode(BaseNode):
     """Represents Unit Ability-Modifier relationship (junction table)."""
-    _name: str = "Row"
+    _name = "Row"
     unit_ability_type: Optional[str] = None
     modifier_id: Optional[str] = None
 
 
 class ChargedUnitAbilityNode(BaseNode):
     """Represents charged ability with recharge mechanics."""
-    _name: str = "Row"
+    _name = "Row"
     unit_ability_type: Optional[str] = None
     recharge_turns: Optional[int] = None
 
@@ -440,7 +442,7 @@ class ChargedUnitAbilityNode(BaseNode):
 
 class LeaderUnlockNode(BaseNode):
     """Represents a leader unlock - age transition for leader/civilization."""
-    _name: str = "Row"
+    _name = "Row"
     leader_domain: Optional[str] = None
     leader_type: Optional[str] = None
     age_domain: Optional[str] = None
@@ -454,7 +456,7 @@ class LeaderUnlockNode(BaseNode):
 
 class LeaderCivilizationBiasNode(BaseNode):
     """Represents leader-civilization bias."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_domain: Optional[str] = None
     civilization_type: Optional[str] = None
     leader_domain: Optional[str] = None
@@ -470,7 +472,7 @@ class LeaderCivilizationBiasNode(BaseNode):
 
 class DistrictFreeConstructibleNode(BaseNode):
     """Represents free constructible from district."""
-    _name: str = "Row"
+    _name = "Row"
     district_type: Optional[str] = None
     constructible_type: Optional[str] = None
 
@@ -481,7 +483,7 @@ class DistrictFreeConstructibleNode(BaseNode):
 
 class StartBiasResourceNode(BaseNode):
     """Represents start bias for resource placement."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     resource_type: Optional[str] = None
     bias: Optional[int] = None
@@ -493,14 +495,14 @@ class StartBiasResourceNode(BaseNode):
 
 class UnitUpgradeNode(BaseNode):
     """Represents unit upgrade path."""
-    _name: str = "Row"
+    _name = "Row"
     unit: Optional[str] = None
     upgrade_unit: Optional[str] = None
 
 
 class UnitAdvisoryNode(BaseNode):
     """Represents unit advisory."""
-    _name: str = "Row"
+    _name = "Row"
     unit_type: Optional[str] = None
     advisory_class_type: Optional[str] = None
 
@@ -511,7 +513,7 @@ class UnitAdvisoryNode(BaseNode):
 
 class UniqueQuarterModifierNode(BaseNode):
     """Represents unique quarter modifier."""
-    _name: str = "Row"
+    _name = "Row"
     unique_quarter_type: Optional[str] = None
     modifier_id: Optional[str] = None
 
@@ -522,7 +524,7 @@ class UniqueQuarterModifierNode(BaseNode):
 
 class CivilizationUnlockNode(BaseNode):
     """Represents civilization unlock (age progression)."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_unlock_id: Optional[str] = None
     unlock_id: Optional[str] = None
     era: Optional[str] = None
@@ -543,13 +545,13 @@ class CivilizationUnlockNode(BaseNode):
 
 class AiListTypeNode(BaseNode):
     """Represents an AI list type definition."""
-    _name: str = "Row"
+    _name = "Row"
     list_type: Optional[str] = None
 
 
 class AiListNode(BaseNode):
     """Represents an AI list assignment to a leader/trait."""
-    _name: str = "Row"
+    _name = "Row"
     list_type: Optional[str] = None
     leader_type: Optional[str] = None
     system: Optional[str] = None
@@ -557,7 +559,7 @@ class AiListNode(BaseNode):
 
 class AiFavoredItemNode(BaseNode):
     """Represents an AI favored item (unit, building, etc)."""
-    _name: str = "Row"
+    _name = "Row"
     list_type: Optional[str] = None
     item: Optional[str] = None
     value: Optional[int] = None
@@ -568,7 +570,7 @@ class AiFavoredItemNode(BaseNode):
 
 class LeaderCivPriorityNode(BaseNode):
     """Represents AI leader civilization priorities."""
-    _name: str = "Row"
+    _name = "Row"
     leader: Optional[str] = None
     civilization: Optional[str] = None
     priority: Optional[int] = None
@@ -576,7 +578,7 @@ class LeaderCivPriorityNode(BaseNode):
 
 class LoadingInfoCivilizationNode(BaseNode):
     """Represents loading screen information for a civilization."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     civilization_text: Optional[str] = None
     subtitle: Optional[str] = None
@@ -588,7 +590,7 @@ class LoadingInfoCivilizationNode(BaseNode):
 
 class CivilizationFavoredWonderNode(BaseNode):
     """Represents wonders favored by a civilization."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     favored_wonder_type: Optional[str] = None
     favored_wonder_name: Optional[str] = None
@@ -600,7 +602,7 @@ class CivilizationFavoredWonderNode(BaseNode):
 
 class LegacyCivilizationNode(BaseNode):
     """Represents legacy civilization data."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     name: Optional[str] = None
     full_name: Optional[str] = None
@@ -610,26 +612,26 @@ class LegacyCivilizationNode(BaseNode):
 
 class LegacyCivilizationTraitNode(BaseNode):
     """Represents legacy civilization-trait relationship."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     trait_type: Optional[str] = None
 
 
 class UpdateWhereNode(BaseNode):
     """Represents a WHERE clause in an Update statement."""
-    _name: str = "Where"
+    _name = "Where"
     independent_type: Optional[str] = None
 
 
 class UpdateSetNode(BaseNode):
     """Represents a SET clause in an Update statement."""
-    _name: str = "Set"
+    _name = "Set"
     name: Optional[str] = None
 
 
 class LegacyIndependentsUpdateNode(BaseNode):
     """Represents an Update statement for LegacyIndependents."""
-    _name: str = "Update"
+    _name = "Update"
     where_clause: Optional[UpdateWhereNode] = None
     set_clause: Optional[UpdateSetNode] = None
 
@@ -656,7 +658,7 @@ class LegacyIndependentsUpdateNode(BaseNode):
 
 class VisualRemapNode(BaseNode):
     """Represents visual remap configuration."""
-    _name: str = "Row"
+    _name = "Row"
     visual_type: Optional[str] = None
     visual_key: Optional[str] = None
     visual_value: Optional[str] = None
@@ -669,7 +671,7 @@ class IconDefinitionNode(BaseNode):
     Supports multi-resolution icons through Context and IconSize attributes,
     allowing different icon files for different UI contexts and sizes.
     """
-    _name: str = "Row"
+    _name = "Row"
     id: Optional[str] = None  # e.g., "CIVILIZATION_BABYLON"
     path: Optional[str] = None  # e.g., "icons/civs/civ_sym_babylon.png"
     context: Optional[str] = None  # e.g., "DEFAULT", "BACKGROUND", "PORTRAIT"
@@ -698,6 +700,167 @@ class IconDefinitionNode(BaseNode):
 
 
 
+# Custom table name mappings for TS compatibility; tables not listed here
+# use the PascalCase form of their field name
+_TABLE_NAME_MAPPING = MappingProxyType({
+    'constructible_maintenances': 'Constructible_Maintenances',
+    'constructible_valid_districts': 'Constructible_ValidDistricts',
+    'constructible_valid_biomes': 'Constructible_ValidBiomes',
+    'constructible_valid_features': 'Constructible_ValidFeatures',
+    'constructible_valid_terrains': 'Constructible_ValidTerrains',
+    'constructible_valid_resources': 'Constructible_ValidResources',
+    'constructible_yield_changes': 'Constructible_YieldChanges',
+    'constructible_adjacencies': 'Constructible_Adjacencies',
+    'constructible_plunders': 'Constructible_Plunders',
+    'constructible_building_cost_progressions': 'Constructible_BuildingCostProgressions',
+    'constructible_advisories': 'Constructible_Advisories',
+    'constructible_warehouse_yields': 'Constructible_WarehouseYields',
+    'district_free_constructibles': 'District_FreeConstructibles',
+    'adjacency_yield_changes': 'Adjacency_YieldChanges',
+    'warehouse_yield_changes': 'Warehouse_YieldChanges',
+    'progression_tree_advisories': 'ProgressionTree_Advisories',
+    'progression_tree_nodes': 'ProgressionTreeNodes',
+    'progression_tree_node_unlocks': 'ProgressionTreeNodeUnlocks',
+    'progression_tree_prereqs': 'ProgressionTreePrereqs',
+    'progression_tree_quotes': 'ProgressionTreeQuotes',
+    'unit_costs': 'Unit_Costs',
+    'unit_stats': 'Unit_Stats',
+    'unit_advisories': 'Unit_Advisories',
+    'unit_replaces': 'UnitReplaces',
+    'unit_upgrades': 'UnitUpgrades',
+    'unit_class_abilities': 'UnitClass_Abilities',
+    'unlock_rewards': 'Unlock_Rewards',
+    'unlock_requirements': 'Unlock_Requirements',
+    'unlock_configuration_values': 'Unlock_ConfigurationValues',
+    'requirement_sets': 'RequirementSets',
+    'requirement_arguments': 'RequirementArguments',
+    'requirement_set_requirements': 'RequirementSetRequirements',
+    'legacy_civilizations': 'LegacyCivilizations',
+    'legacy_civilization_traits': 'LegacyCivilizationTraits',
+    'legacy_independents': 'LegacyIndependents',
+    'civilization_items': 'CivilizationItems',
+    'civilization_tags': 'CivilizationTags',
+    'civilization_traits': 'CivilizationTraits',
+    'civilization_unlocks': 'CivilizationUnlocks',
+    'leader_unlocks': 'LeaderUnlocks',
+    'leader_civilization_bias': 'LeaderCivilizationBias',
+    'type_tags': 'TypeTags',
+    'trait_modifiers': 'TraitModifiers',
+    'tradition_modifiers': 'TraditionModifiers',
+    'unique_quarters': 'UniqueQuarters',
+    'unique_quarter_modifiers': 'UniqueQuarterModifiers',
+    'game_modifiers': 'GameModifiers',
+    'modifier_strings': 'ModifierStrings',
+    'icon_definitions': 'IconDefinitions',
+    'visual_remaps': 'VisualRemaps',
+    'english_text': 'EnglishText',
+    'city_names': 'CityNames',
+    'civilization_citizen_names': 'CivilizationCitizenNames',
+    'start_bias_biomes': 'StartBiasBiomes',
+    'start_bias_resources': 'StartBiasResources',
+    'start_bias_terrains': 'StartBiasTerrains',
+    'start_bias_rivers': 'StartBiasRivers',
+    'start_bias_feature_classes': 'StartBiasFeatureClasses',
+    'start_bias_adjacent_to_coasts': 'StartBiasAdjacentToCoasts',
+    'vis_art_civilization_building_cultures': 'VisArt_CivilizationBuildingCultures',
+    'vis_art_civilization_unit_cultures': 'VisArt_CivilizationUnitCultures',
+    'ai_list_types': 'AiListTypes',
+    'ai_lists': 'AiLists',
+    'ai_favored_items': 'AiFavoredItems',
+    'leader_civ_priorities': 'LeaderCivPriorities',
+    'loading_info_civilizations': 'LoadingInfo_Civilizations',
+    'civilization_favored_wonders': 'CivilizationFavoredWonders',
+    'named_places': 'NamedPlaces',
+    'named_place_yields': 'NamedPlace_Yields',
+    'named_rivers': 'NamedRivers',
+    'named_volcanoes': 'NamedVolcanoes',
+    'named_river_civilizations': 'NamedRiverCivilizations',
+    'named_volcano_civilizations': 'NamedVolcanoCivilizations',
+})
+
+
+@cache
+def _table_name(field_name: str) -> str:
+    """Return the XML table name for a DatabaseNode field (mapping, else PascalCase)."""
+    mapped = _TABLE_NAME_MAPPING.get(field_name)
+    if mapped:
+        return mapped
+    return sys.intern(''.join(word.capitalize() for word in field_name.split('_')))
+
+
+# Preferred table order to match game schema expectations; list fields not
+# named here follow in declaration order
+_PREFERRED_TABLE_ORDER = (
+    "kinds",
+    "types",
+    "constructibles",
+    "buildings",
+    "improvements",
+    "unique_quarters",
+    "type_tags",
+    "constructible_valid_districts",
+    "constructible_valid_terrains",
+    "constructible_valid_resources",
+    "constructible_valid_biomes",
+    "constructible_valid_features",
+    "constructible_yield_changes",
+    "constructible_maintenances",
+    "constructible_adjacencies",
+    "constructible_advisories",
+    "adjacency_yield_changes",
+    "constructible_plunders",
+    "constructible_warehouse_yields",
+    "warehouse_yield_changes",
+    "district_free_constructibles",
+    "legacy_civilizations",
+    "legacy_civilization_traits",
+    "legacy_independents",
+    "traits",
+    "trait_modifiers",
+    "civilizations",
+    "civilization_traits",
+    "civilization_tags",
+    "civilization_items",
+    "civilization_unlocks",
+    "leader_unlocks",
+    "leader_civilization_bias",
+    "city_names",
+    "start_bias_biomes",
+    "start_bias_resources",
+    "start_bias_terrains",
+    "start_bias_rivers",
+    "start_bias_feature_classes",
+    "start_bias_adjacent_to_coasts",
+    "vis_art_civilization_building_cultures",
+    "vis_art_civilization_unit_cultures",
+    "ai_list_types",
+    "ai_lists",
+    "ai_favored_items",
+    "leader_civ_priorities",
+    "loading_info_civilizations",
+    "civilization_favored_wonders",
+    "units",
+    "unit_stats",
+    "unit_costs",
+    "unit_replaces",
+    "unit_upgrades",
+    "unit_advisories",
+    "progression_trees",
+    "progression_tree_nodes",
+    "progression_tree_prereqs",
+    "progression_tree_node_unlocks",
+    "progression_tree_advisories",
+    "progression_tree_quotes",
+    "traditions",
+    "tradition_modifiers",
+    "game_modifiers",
+    "modifier_strings",
+    "icon_definitions",
+    "visual_remaps",
+    "english_text",
+)
+
+
 # ============================================================================
 # MAIN DATABASE NODE
 # ============================================================================
@@ -711,151 +874,151 @@ class DatabaseNode(BaseNode):
     all builders use to generate mod output.
     """
     
-    _name: str = "Database"
+    _name = "Database"
     
     # Type System
-    kinds: list['KindNode'] = []
-    types: list['TypeNode'] = []
-    tags: list['TagNode'] = []
-    type_tags: list['TypeTagNode'] = []
+    kinds: list['KindNode'] = Field(default_factory=list)
+    types: list['TypeNode'] = Field(default_factory=list)
+    tags: list['TagNode'] = Field(default_factory=list)
+    type_tags: list['TypeTagNode'] = Field(default_factory=list)
     
     # Traits
-    traits: list['TraitNode'] = []
-    trait_modifiers: list['TraitModifierNode'] = []
+    traits: list['TraitNode'] = Field(default_factory=list)
+    trait_modifiers: list['TraitModifierNode'] = Field(default_factory=list)
     
     # Civilizations
-    civilizations: list['BaseNode'] = []  # Can be CivilizationNode or slice types
-    civilization_items: list['CivilizationItemNode'] = []
-    civilization_tags: list['CivilizationTagNode'] = []
-    civilization_traits: list = []
-    civilization_unlocks: list['CivilizationUnlockNode'] = []
-    legacy_civilization_traits: list['LegacyCivilizationTraitNode'] = []
-    legacy_civilizations: list['LegacyCivilizationNode'] = []
-    legacy_independents: list['LegacyIndependentsUpdateNode'] = []
+    civilizations: list['BaseNode'] = Field(default_factory=list)  # Can be CivilizationNode or slice types
+    civilization_items: list['CivilizationItemNode'] = Field(default_factory=list)
+    civilization_tags: list['CivilizationTagNode'] = Field(default_factory=list)
+    civilization_traits: list['CivilizationTraitNode'] = Field(default_factory=list)
+    civilization_unlocks: list['CivilizationUnlockNode'] = Field(default_factory=list)
+    legacy_civilization_traits: list['LegacyCivilizationTraitNode'] = Field(default_factory=list)
+    legacy_civilizations: list['LegacyCivilizationNode'] = Field(default_factory=list)
+    legacy_independents: list['LegacyIndependentsUpdateNode'] = Field(default_factory=list)
     
     # Leaders
-    leader_unlocks: list['BaseNode'] = []
-    leader_civilization_bias: list['LeaderCivilizationBiasNode'] = []
+    leader_unlocks: list['BaseNode'] = Field(default_factory=list)
+    leader_civilization_bias: list['LeaderCivilizationBiasNode'] = Field(default_factory=list)
     
     # Buildings & Improvements
-    buildings: list['BuildingNode'] = []
-    improvements: list['ImprovementNode'] = []
-    constructibles: list['BaseNode'] = []
-    constructible_maintenances: list['ConstructibleMaintenanceNode'] = []
-    constructible_valid_districts: list['ConstructibleValidDistrictNode'] = []
-    constructible_valid_biomes: list['ConstructibleValidBiomeNode'] = []
-    constructible_valid_features: list['ConstructibleValidFeatureNode'] = []
-    constructible_valid_terrains: list['ConstructibleValidTerrainNode'] = []
-    constructible_valid_resources: list['ConstructibleValidResourceNode'] = []
-    constructible_yield_changes: list['BaseNode'] = []
-    adjacency_yield_changes: list['BaseNode'] = []
-    constructible_adjacencies: list['ConstructibleAdjacencyNode'] = []
-    warehouse_yield_changes: list['WarehouseYieldChangeNode'] = []
-    constructible_warehouse_yields: list['ConstructibleWarehouseYieldNode'] = []
-    constructible_plunders: list['ConstructiblePlunderNode'] = []
-    constructible_modifiers: list['ConstructibleModifierNode'] = []
-    constructible_building_cost_progressions: list['ConstructibleBuildingCostProgressionNode'] = []
-    constructible_advisories: list['ConstructibleAdvisoryNode'] = []
+    buildings: list['BuildingNode'] = Field(default_factory=list)
+    improvements: list['ImprovementNode'] = Field(default_factory=list)
+    constructibles: list['BaseNode'] = Field(default_factory=list)
+    constructible_maintenances: list['ConstructibleMaintenanceNode'] = Field(default_factory=list)
+    constructible_valid_districts: list['ConstructibleValidDistrictNode'] = Field(default_factory=list)
+    constructible_valid_biomes: list['ConstructibleValidBiomeNode'] = Field(default_factory=list)
+    constructible_valid_features: list['ConstructibleValidFeatureNode'] = Field(default_factory=list)
+    constructible_valid_terrains: list['ConstructibleValidTerrainNode'] = Field(default_factory=list)
+    constructible_valid_resources: list['ConstructibleValidResourceNode'] = Field(default_factory=list)
+    constructible_yield_changes: list['BaseNode'] = Field(default_factory=list)
+    adjacency_yield_changes: list['BaseNode'] = Field(default_factory=list)
+    constructible_adjacencies: list['ConstructibleAdjacencyNode'] = Field(default_factory=list)
+    warehouse_yield_changes: list['WarehouseYieldChangeNode'] = Field(default_factory=list)
+    constructible_warehouse_yields: list['ConstructibleWarehouseYieldNode'] = Field(default_factory=list)
+    constructible_plunders: list['ConstructiblePlunderNode'] = Field(default_factory=list)
+    constructible_modifiers: list['ConstructibleModifierNode'] = Field(default_factory=list)
+    constructible_building_cost_progressions: list['ConstructibleBuildingCostProgressionNode'] = Field(default_factory=list)
+    constructible_advisories: list['ConstructibleAdvisoryNode'] = Field(default_factory=list)
     
     # Cities
-    city_names: list['BaseNode'] = []
-    civilization_citizen_names: list['BaseNode'] = []
+    city_names: list['BaseNode'] = Field(default_factory=list)
+    civilization_citizen_names: list['BaseNode'] = Field(default_factory=list)
     
     # Districts
-    district_free_constructibles: list['DistrictFreeConstructibleNode'] = []
+    district_free_constructibles: list['DistrictFreeConstructibleNode'] = Field(default_factory=list)
     
     # Progression Trees
-    progression_tree_advisories: list['ProgressionTreeAdvisoryNode'] = []
-    progression_trees: list['BaseNode'] = []
-    progression_tree_nodes: list['BaseNode'] = []
-    progression_tree_node_unlocks: list['ProgressionTreeNodeUnlockNode'] = []
-    progression_tree_prereqs: list['BaseNode'] = []
-    progression_tree_quotes: list['ProgressionTreeQuoteNode'] = []
-    type_quotes: list['TypeQuoteNode'] = []
+    progression_tree_advisories: list['ProgressionTreeAdvisoryNode'] = Field(default_factory=list)
+    progression_trees: list['BaseNode'] = Field(default_factory=list)
+    progression_tree_nodes: list['BaseNode'] = Field(default_factory=list)
+    progression_tree_node_unlocks: list['ProgressionTreeNodeUnlockNode'] = Field(default_factory=list)
+    progression_tree_prereqs: list['BaseNode'] = Field(default_factory=list)
+    progression_tree_quotes: list['ProgressionTreeQuoteNode'] = Field(default_factory=list)
+    type_quotes: list['TypeQuoteNode'] = Field(default_factory=list)
     
     # Traditions
-    traditions: list['BaseNode'] = []
-    tradition_modifiers: list['TraditionModifierNode'] = []
+    traditions: list['BaseNode'] = Field(default_factory=list)
+    tradition_modifiers: list['TraditionModifierNode'] = Field(default_factory=list)
     
     # Great People
-    great_persons: list['BaseNode'] = []
+    great_persons: list['BaseNode'] = Field(default_factory=list)
     
     # Named Places
-    named_places: list['BaseNode'] = []
-    named_place_yields: list['BaseNode'] = []
-    named_rivers: list['BaseNode'] = []
-    named_volcanoes: list['BaseNode'] = []
-    named_river_civilizations: list['BaseNode'] = []
-    named_volcano_civilizations: list['BaseNode'] = []
+    named_places: list['BaseNode'] = Field(default_factory=list)
+    named_place_yields: list['BaseNode'] = Field(default_factory=list)
+    named_rivers: list['BaseNode'] = Field(default_factory=list)
+    named_volcanoes: list['BaseNode'] = Field(default_factory=list)
+    named_river_civilizations: list['BaseNode'] = Field(default_factory=list)
+    named_volcano_civilizations: list['BaseNode'] = Field(default_factory=list)
     
     # Advanced Unit & Building Features (Phase 5)
-    unit_tier_variants: list['BaseNode'] = []
-    adjacency_bonuses: list['BaseNode'] = []
-    multi_tile_buildings: list['BaseNode'] = []
+    unit_tier_variants: list['BaseNode'] = Field(default_factory=list)
+    adjacency_bonuses: list['BaseNode'] = Field(default_factory=list)
+    multi_tile_buildings: list['BaseNode'] = Field(default_factory=list)
     
     # Units
-    units: list['BaseNode'] = []
-    unit_costs: list['BaseNode'] = []
-    unit_replaces: list['BaseNode'] = []
-    unit_upgrades: list['UnitUpgradeNode'] = []
-    unit_stats: list['BaseNode'] = []
-    unit_advisories: list['UnitAdvisoryNode'] = []
+    units: list['BaseNode'] = Field(default_factory=list)
+    unit_costs: list['BaseNode'] = Field(default_factory=list)
+    unit_replaces: list['BaseNode'] = Field(default_factory=list)
+    unit_upgrades: list['UnitUpgradeNode'] = Field(default_factory=list)
+    unit_stats: list['BaseNode'] = Field(default_factory=list)
+    unit_advisories: list['UnitAdvisoryNode'] = Field(default_factory=list)
     
     # Unit Abilities
-    unit_abilities: list['UnitAbilityNode'] = []
-    unit_class_abilities: list['UnitClassAbilityNode'] = []
-    unit_ability_modifiers: list['UnitAbilityModifierNode'] = []
-    charged_unit_abilities: list['ChargedUnitAbilityNode'] = []
+    unit_abilities: list['UnitAbilityNode'] = Field(default_factory=list)
+    unit_class_abilities: list['UnitClassAbilityNode'] = Field(default_factory=list)
+    unit_ability_modifiers: list['UnitAbilityModifierNode'] = Field(default_factory=list)
+    charged_unit_abilities: list['ChargedUnitAbilityNode'] = Field(default_factory=list)
     
     # Unlocks & Requirements
-    unlocks: list['UnlockNode'] = []
-    unlock_rewards: list['UnlockRewardNode'] = []
-    unlock_requirements: list['UnlockRequirementNode'] = []
-    unlock_configuration_values: list['UnlockConfigurationValueNode'] = []
+    unlocks: list['UnlockNode'] = Field(default_factory=list)
+    unlock_rewards: list['UnlockRewardNode'] = Field(default_factory=list)
+    unlock_requirements: list['UnlockRequirementNode'] = Field(default_factory=list)
+    unlock_configuration_values: list['UnlockConfigurationValueNode'] = Field(default_factory=list)
     
-    requirement_sets: list['RequirementSetNode'] = []
-    requirements: list['RequirementNode'] = []
-    requirement_arguments: list['RequirementArgumentNode'] = []
-    requirement_set_requirements: list['RequirementSetRequirementNode'] = []
+    requirement_sets: list['RequirementSetNode'] = Field(default_factory=list)
+    requirements: list['RequirementNode'] = Field(default_factory=list)
+    requirement_arguments: list['RequirementArgumentNode'] = Field(default_factory=list)
+    requirement_set_requirements: list['RequirementSetRequirementNode'] = Field(default_factory=list)
     
     # Text & Icons
-    english_text: list['BaseNode'] = []
-    icon_definitions: list['IconDefinitionNode'] = []
-    visual_remaps: list['VisualRemapNode'] = []
+    english_text: list['BaseNode'] = Field(default_factory=list)
+    icon_definitions: list['IconDefinitionNode'] = Field(default_factory=list)
+    visual_remaps: list['VisualRemapNode'] = Field(default_factory=list)
     
     # Unique Quarters
-    unique_quarters: list['BaseNode'] = []
-    unique_quarter_modifiers: list['UniqueQuarterModifierNode'] = []
+    unique_quarters: list['BaseNode'] = Field(default_factory=list)
+    unique_quarter_modifiers: list['UniqueQuarterModifierNode'] = Field(default_factory=list)
     
     # Modifiers
-    game_modifiers: list['GameModifierNode'] = []
-    modifier_strings: list['ModifierStringNode'] = []
+    game_modifiers: list['GameModifierNode'] = Field(default_factory=list)
+    modifier_strings: list['ModifierStringNode'] = Field(default_factory=list)
     
     # Start Biases
-    start_bias_biomes: list['BaseNode'] = []
-    start_bias_resources: list['StartBiasResourceNode'] = []
-    start_bias_terrains: list['BaseNode'] = []
-    start_bias_rivers: list['BaseNode'] = []
-    start_bias_feature_classes: list['BaseNode'] = []
-    start_bias_adjacent_to_coasts: list['BaseNode'] = []
+    start_bias_biomes: list['BaseNode'] = Field(default_factory=list)
+    start_bias_resources: list['StartBiasResourceNode'] = Field(default_factory=list)
+    start_bias_terrains: list['BaseNode'] = Field(default_factory=list)
+    start_bias_rivers: list['BaseNode'] = Field(default_factory=list)
+    start_bias_feature_classes: list['BaseNode'] = Field(default_factory=list)
+    start_bias_adjacent_to_coasts: list['BaseNode'] = Field(default_factory=list)
     
     # Visual Arts
-    vis_art_civilization_building_cultures: list['BaseNode'] = []
-    vis_art_civilization_unit_cultures: list['BaseNode'] = []
+    vis_art_civilization_building_cultures: list['BaseNode'] = Field(default_factory=list)
+    vis_art_civilization_unit_cultures: list['BaseNode'] = Field(default_factory=list)
     
     # AI Configuration
-    ai_list_types: list['AiListTypeNode'] = []
-    ai_lists: list['AiListNode'] = []
-    ai_favored_items: list['AiFavoredItemNode'] = []
-    leader_civ_priorities: list['LeaderCivPriorityNode'] = []
-    loading_info_civilizations: list['LoadingInfoCivilizationNode'] = []
-    civilization_favored_wonders: list['CivilizationFavoredWonderNode'] = []
+    ai_list_types: list['AiListTypeNode'] = Field(default_factory=list)
+    ai_lists: list['AiListNode'] = Field(default_factory=list)
+    ai_favored_items: list['AiFavoredItemNode'] = Field(default_factory=list)
+    leader_civ_priorities: list['LeaderCivPriorityNode'] = Field(default_factory=list)
+    loading_info_civilizations: list['LoadingInfoCivilizationNode'] = Field(default_factory=list)
+    civilization_favored_wonders: list['CivilizationFavoredWonderNode'] = Field(default_factory=list)
 
     def __init__(self, payload: dict | None = None) -> None:
         """Initialize DatabaseNode with optional payload."""
         super().__init__()
         if payload:
-            self.fill(payload)
+            self.fill(payload, validate=False)
 
     def to_xml_element(self) -> dict | None:
         """
@@ -874,201 +1037,99 @@ class DatabaseNode(BaseNode):
             {
                 'Database': {
                     'Types': [
-                        {'_name': 'Row', '_attrs': {'Type': 'VAL', 'Kind': 'KIND'}},
-                        {'_name': 'Row', '_attrs': {'Type': 'VAL2', 'Kind': 'KIND2'}}
+                        XmlRow('Row', {'Type': 'VAL', 'Kind': 'KIND'}),
+                        XmlRow('Row', {'Type': 'VAL2', 'Kind': 'KIND2'})
                     ],
                     'Units': [...]
                 }
             }
         """
-        # Check if all arrays are empty
-        array_attrs = [
-            attr for attr in dir(self)
-            if not attr.startswith('_') and isinstance(getattr(self, attr), list)
-        ]
-        if all(len(getattr(self, attr, [])) == 0 for attr in array_attrs):
-            return None
-
+        # Read each table field straight from __dict__ in output order; empty
+        # tables are skipped, so an empty database falls through to None below
         data = {}
-        
-        # Custom table name mappings for TS compatibility
-        table_name_mapping = {
-            'constructible_maintenances': 'Constructible_Maintenances',
-            'constructible_valid_districts': 'Constructible_ValidDistricts',
-            'constructible_valid_biomes': 'Constructible_ValidBiomes',
-            'constructible_valid_features': 'Constructible_ValidFeatures',
-            'constructible_valid_terrains': 'Constructible_ValidTerrains',
-            'constructible_valid_resources': 'Constructible_ValidResources',
-            'constructible_yield_changes': 'Constructible_YieldChanges',
-            'constructible_adjacencies': 'Constructible_Adjacencies',
-            'constructible_plunders': 'Constructible_Plunders',
-            'constructible_building_cost_progressions': 'Constructible_BuildingCostProgressions',
-            'constructible_advisories': 'Constructible_Advisories',
-            'constructible_warehouse_yields': 'Constructible_WarehouseYields',
-            'district_free_constructibles': 'District_FreeConstructibles',
-            'adjacency_yield_changes': 'Adjacency_YieldChanges',
-            'warehouse_yield_changes': 'Warehouse_YieldChanges',
-            'progression_tree_advisories': 'ProgressionTree_Advisories',
-            'progression_tree_nodes': 'ProgressionTreeNodes',
-            'progression_tree_node_unlocks': 'ProgressionTreeNodeUnlocks',
-            'progression_tree_prereqs': 'ProgressionTreePrereqs',
-            'progression_tree_quotes': 'ProgressionTreeQuotes',
-            'unit_costs': 'Unit_Costs',
-            'unit_stats': 'Unit_Stats',
-            'unit_advisories': 'Unit_Advisories',
-            'unit_replaces': 'UnitReplaces',
-            'unit_upgrades': 'UnitUpgrades',
-            'unit_class_abilities': 'UnitClass_Abilities',
-            'unlock_rewards': 'Unlock_Rewards',
-            'unlock_requirements': 'Unlock_Requirements',
-            'unlock_configuration_values': 'Unlock_ConfigurationValues',
-            'requirement_sets': 'RequirementSets',
-            'requirement_arguments': 'RequirementArguments',
-            'requirement_set_requirements': 'RequirementSetRequirements',
-            'legacy_civilizations': 'LegacyCivilizations',
-            'legacy_civilization_traits': 'LegacyCivilizationTraits',
-            'legacy_independents': 'LegacyIndependents',
-            'civilization_items': 'CivilizationItems',
-            'civilization_tags': 'CivilizationTags',
-            'civilization_traits': 'CivilizationTraits',
-            'civilization_unlocks': 'CivilizationUnlocks',
-            'leader_unlocks': 'LeaderUnlocks',
-            'leader_civilization_bias': 'LeaderCivilizationBias',
-            'type_tags': 'TypeTags',
-            'trait_modifiers': 'TraitModifiers',
-            'tradition_modifiers': 'TraditionModifiers',
-            'unique_quarters': 'UniqueQuarters',
-            'unique_quarter_modifiers': 'UniqueQuarterModifiers',
-            'game_modifiers': 'GameModifiers',
-            'modifier_strings': 'ModifierStrings',
-            'icon_definitions': 'IconDefinitions',
-            'visual_remaps': 'VisualRemaps',
-            'english_text': 'EnglishText',
-            'city_names': 'CityNames',
-            'civilization_citizen_names': 'CivilizationCitizenNames',
-            'start_bias_biomes': 'StartBiasBiomes',
-            'start_bias_resources': 'StartBiasResources',
-            'start_bias_terrains': 'StartBiasTerrains',
-            'start_bias_rivers': 'StartBiasRivers',
-            'start_bias_feature_classes': 'StartBiasFeatureClasses',
-            'start_bias_adjacent_to_coasts': 'StartBiasAdjacentToCoasts',
-            'vis_art_civilization_building_cultures': 'VisArt_CivilizationBuildingCultures',
-            'vis_art_civilization_unit_cultures': 'VisArt_CivilizationUnitCultures',
-            'ai_list_types': 'AiListTypes',
-            'ai_lists': 'AiLists',
-            'ai_favored_items': 'AiFavoredItems',
-            'leader_civ_priorities': 'LeaderCivPriorities',
-            'loading_info_civilizations': 'LoadingInfo_Civilizations',
-            'civilization_favored_wonders': 'CivilizationFavoredWonders',
-            'named_places': 'NamedPlaces',
-            'named_place_yields': 'NamedPlace_Yields',
-            'named_rivers': 'NamedRivers',
-            'named_volcanoes': 'NamedVolcanoes',
-            'named_river_civilizations': 'NamedRiverCivilizations',
-            'named_volcano_civilizations': 'NamedVolcanoCivilizations',
-        }
-        
-        # Preferred table order to match game schema expectations
-        preferred_order = [
-            "kinds",
-            "types",
-            "constructibles",
-            "buildings",
-            "improvements",
-            "unique_quarters",
-            "type_tags",
-            "constructible_valid_districts",
-            "constructible_valid_terrains",
-            "constructible_valid_resources",
-            "constructible_valid_biomes",
-            "constructible_valid_features",
-            "constructible_yield_changes",
-            "constructible_maintenances",
-            "constructible_adjacencies",
-            "constructible_advisories",
-            "adjacency_yield_changes",
-            "constructible_plunders",
-            "constructible_warehouse_yields",
-            "warehouse_yield_changes",
-            "district_free_constructibles",
-            "legacy_civilizations",
-            "legacy_civilization_traits",
-            "legacy_independents",
-            "traits",
-            "trait_modifiers",
-            "civilizations",
-            "civilization_traits",
-            "civilization_tags",
-            "civilization_items",
-            "civilization_unlocks",
-            "leader_unlocks",
-            "leader_civilization_bias",
-            "city_names",
-            "start_bias_biomes",
-            "start_bias_resources",
-            "start_bias_terrains",
-            "start_bias_rivers",
-            "start_bias_feature_classes",
-            "start_bias_adjacent_to_coasts",
-            "vis_art_civilization_building_cultures",
-            "vis_art_civilization_unit_cultures",
-            "ai_list_types",
-            "ai_lists",
-            "ai_favored_items",
-            "leader_civ_priorities",
-            "loading_info_civilizations",
-            "civilization_favored_wonders",
-            "units",
-            "unit_stats",
-            "unit_costs",
-            "unit_replaces",
-            "unit_upgrades",
-            "unit_advisories",
-            "progression_trees",
-            "progression_tree_nodes",
-            "progression_tree_prereqs",
-            "progression_tree_node_unlocks",
-            "progression_tree_advisories",
-            "progression_tree_quotes",
-            "traditions",
-            "tradition_modifiers",
-            "game_modifiers",
-            "modifier_strings",
-            "icon_definitions",
-            "visual_remaps",
-            "english_text",
-        ]
-        ordered_fields = preferred_order + [
-            field for field in self.model_fields if field not in preferred_order
-        ]
-
-        # Iterate through properties in preferred order
-        for attr_name in ordered_fields:
-            attr_value = getattr(self, attr_name, None)
-            
-            # Skip non-list attributes
-            if not isinstance(attr_value, list) or len(attr_value) == 0:
+        d = self.__dict__
+        for field_name in _list_fields(type(self)):
+            nodes = d.get(field_name)
+            if not nodes:
                 continue
-            
-            # Get table name (use mapping or convert from snake_case)
-            if attr_name in table_name_mapping:
-                table_name = table_name_mapping[attr_name]
-            else:
-                # Convert snake_case to PascalCase
-                words = attr_name.split('_')
-                table_name = ''.join(word.capitalize() for word in words)
-            
-            # Convert nodes to jstoxml format (array of {_name, _attrs})
-            # Each node returns {'_name': 'Row', '_attrs': {...}}
-            rows = []
-            for node in attr_value:
-                if node:
-                    xml_elem = node.to_xml_element()
-                    if xml_elem is not None:
-                        rows.append(xml_elem)
-            
-            # Only add table if it has rows
+            rows = [
+                xml_elem
+                for node in nodes
+                if node is not None and (xml_elem := node.to_xml_element()) is not None
+            ]
             if rows:
-                data[table_name] = rows
+                data[_TABLE_NAMES.get(field_name) or _table_name(field_name)] = rows
         
         return {'Database': data} if data else None
+
+    def iter_xml(self) -> Iterator[tuple[str, XmlElement]]:
+        """
+        Yield (table name, row) pairs for every non-empty row, in output order.
+        
+        Rows are produced lazily, one node at a time, so consumers can write
+        them out without the whole Database structure being built first.
+        
+        Yields:
+            Table element name and the node's XML row
+        """
+        d = self.__dict__
+        for attr_name in _list_fields(type(self)):
+            nodes = d.get(attr_name)
+            if not nodes:
+                continue
+            table_name = _TABLE_NAMES.get(attr_name) or _table_name(attr_name)
+            for node in nodes:
+                if node is not None and (row := node.to_xml_element()) is not None:
+                    yield table_name, row
+
+    def write_xml(self, out: TextIO, indent: str = "    ", level: int = 0) -> None:
+        """
+        Stream the Database XML to a text stream, one row at a time.
+        
+        Writes the same text XmlBuilder.build produces for to_xml_element()
+        (without the XML declaration), consuming iter_xml() so it never holds
+        more than the current row: tags for the Database and each table are
+        opened on their first non-empty row. Nothing is written for an empty
+        database.
+        
+        Args:
+            out: Text stream (file or io.StringIO) to write to
+            indent: Indentation string
+            level: Indentation level of the Database element
+        """
+        write = out.write
+        write_row = XmlBuilder.write_row
+        root_indent = indent * level
+        table_indent = indent * (level + 1)
+        row_level = level + 2
+        current = None
+        for table_name, row in self.iter_xml():
+            if table_name != current:
+                if current is None:
+                    write(f"{root_indent}<Database>\n")
+                else:
+                    write(f"{table_indent}</{current}>\n")
+                current = table_name
+                write(f"{table_indent}<{table_name}>\n")
+            write_row(out, row, indent, row_level)
+            write("\n")
+        if current is not None:
+            write(f"{table_indent}</{current}>\n")
+            write(f"{root_indent}</Database>")
+
+
+# Table name for every DatabaseNode field, resolved once at import
+_TABLE_NAMES = MappingProxyType({
+    field_name: _table_name(field_name) for field_name in DatabaseNode.model_fields
+})
+
+
+@cache
+def _list_fields(cls: type[DatabaseNode]) -> tuple[str, ...]:
+    """Return a DatabaseNode class's list (table) fields in output order."""
+    list_fields = [
+        name for name, field in cls.model_fields.items()
+        if field.annotation is list or get_origin(field.annotation) is list
+    ]
+    preferred = [name for name in _PREFERRED_TABLE_ORDER if name in list_fields]
+    return tuple(preferred + [name for name in list_fields if name not in preferred])
@@ -1,13 +1,14 @@
 """Specialized node classes for Civ7 mod entities."""
 
 from typing import Optional
+from pydantic import Field
 from civ7_modding_tools.nodes.base import BaseNode
 
 
 # Civilization Nodes
 class CivilizationNode(BaseNode):
     """Represents a Civilization database row (adaptive for game/shell scope)."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     # Game scope properties
     name: Optional[str] = None
@@ -30,7 +31,7 @@ class CivilizationNode(BaseNode):
 
 class CivilizationTraitNode(BaseNode):
     """Represents a Civilization-Trait relationship."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     trait_type: Optional[str] = None
 
@@ -38,7 +39,7 @@ class CivilizationTraitNode(BaseNode):
 # Unit Nodes
 class UnitNode(BaseNode):
     """Represents a Unit database row."""
-    _name: str = "Row"
+    _name = "Row"
     unit_type: Optional[str] = None
     base_moves: Optional[int] = None
     base_sight_range: Optional[int] = None
@@ -72,7 +73,7 @@ class UnitNode(BaseNode):
 
 class UnitStatNode(BaseNode):
     """Represents unit stats."""
-    _name: str = "Row"
+    _name = "Row"
     unit_type: Optional[str] = None
     combat: Optional[int] = None
     ranged_combat: Optional[int] = None
@@ -83,7 +84,7 @@ class UnitStatNode(BaseNode):
 
 class UnitCostNode(BaseNode):
     """Represents unit production cost."""
-    _name: str = "Row"
+    _name = "Row"
     unit_type: Optional[str] = None
     yield_type: Optional[str] = None
     cost: Optional[int] = None
@@ -92,7 +93,7 @@ class UnitCostNode(BaseNode):
 # Constructible Nodes (Buildings, Improvements)
 class ConstructibleNode(BaseNode):
     """Represents a Building/Improvement database row."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     constructible_class: Optional[str] = "BUILDING"
     name: Optional[str] = None
@@ -120,7 +121,7 @@ class ConstructibleNode(BaseNode):
 
 class ConstructibleYieldChangeNode(BaseNode):
     """Represents yield changes from constructibles."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     yield_type: Optional[str] = None
     yield_change: Optional[int] = None
@@ -128,7 +129,7 @@ class ConstructibleYieldChangeNode(BaseNode):
 
 class NamedPlaceYieldChangeNode(BaseNode):
     """Represents yield changes from named places."""
-    _name: str = "Row"
+    _name = "Row"
     named_place_type: Optional[str] = None
     yield_type: Optional[str] = None
     yield_change: Optional[int] = None
@@ -137,7 +138,7 @@ class NamedPlaceYieldChangeNode(BaseNode):
 # Localization Nodes
 class EnglishTextNode(BaseNode):
     """Represents English text localization."""
-    _name: str = "Row"
+    _name = "Row"
     tag: Optional[str] = None
     text: Optional[str] = None
 
@@ -164,14 +165,14 @@ class EnglishTextNode(BaseNode):
 
 class CityNameNode(BaseNode):
     """Represents a city name."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     city_name: Optional[str] = None
 
 
 class CivilizationCitizenNameNode(BaseNode):
     """Represents a citizen name for a civilization."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     citizen_name: Optional[str] = None
     female: Optional[bool] = None
@@ -180,7 +181,7 @@ class CivilizationCitizenNameNode(BaseNode):
 # Progression Tree Nodes
 class ProgressionTreeNode(BaseNode):
     """Represents a progression tree."""
-    _name: str = "Row"
+    _name = "Row"
     progression_tree_type: Optional[str] = None
     age_type: Optional[str] = "AGE_ANTIQUITY"
     system_type: Optional[str] = "SYSTEM_CULTURE"
@@ -189,7 +190,7 @@ class ProgressionTreeNode(BaseNode):
 
 class ProgressionTreeNodeNode(BaseNode):
     """Represents a node in a progression tree."""
-    _name: str = "Row"
+    _name = "Row"
     progression_tree_node_type: Optional[str] = None
     progression_tree: Optional[str] = None
     cost: Optional[int] = 150
@@ -200,9 +201,60 @@ class ProgressionTreeNodeNode(BaseNode):
 
 
 # Modifier/Effect Nodes
+def _text(value: object) -> str:
+    """Element text for a value: '' for None, str values as-is, else str()."""
+    if type(value) is str:
+        return value
+    return '' if value is None else str(value)
+
+
+def _argument_xml(arg: dict) -> dict:
+    """Build an Argument element from a {'name': ..., 'value': ...} dict."""
+    return {
+        '_name': 'Argument',
+        '_attrs': {'name': arg['name']},
+        '_content': _text(arg.get('value'))
+    }
+
+
+def _string_xml(string: dict) -> dict:
+    """Build a String element from a {'context': ..., 'value': ...} dict."""
+    return {
+        '_name': 'String',
+        '_attrs': {'context': string['context']},
+        '_content': _text(string.get('value'))
+    }
+
+
+def _requirement_xml(type_: str, arguments: list[dict]) -> dict:
+    """
+    Build a Requirement element with its nested Arguments.
+    
+    Shared by ModifierRequirementNode and ModifierNode, so modifiers can
+    serialize their requirement dicts without creating a node for each.
+    
+    Args:
+        type_: Requirement type
+        arguments: Argument dicts; entries without a 'name' are skipped
+        
+    Returns:
+        Requirement element in jstoxml format
+    """
+    arg_elements = [
+        _argument_xml(arg)
+        for arg in arguments
+        if isinstance(arg, dict) and 'name' in arg
+    ]
+    return {
+        '_name': 'Requirement',
+        '_attrs': {'type': type_},
+        '_content': arg_elements if arg_elements else None
+    }
+
+
 class ArgumentNode(BaseNode):
     """Represents a modifier argument."""
-    _name: str = "Argument"
+    _name = "Argument"
     name: Optional[str] = None
     value: Optional[str] = None
     
@@ -213,13 +265,13 @@ class ArgumentNode(BaseNode):
         return {
             '_name': 'Argument',
             '_attrs': {'name': self.name},
-            '_content': str(self.value) if self.value is not None else ''
+            '_content': _text(self.value)
         }
 
 
 class StringNode(BaseNode):
     """Represents a modifier string (for localization)."""
-    _name: str = "String"
+    _name = "String"
     context: Optional[str] = None
     value: Optional[str] = None
     
@@ -230,49 +282,34 @@ class StringNode(BaseNode):
         return {
             '_name': 'String',
             '_attrs': {'context': self.context},
-            '_content': str(self.value) if self.value is not None else ''
+            '_content': _text(self.value)
         }
 
 
 class ModifierRequirementNode(BaseNode):
     """Represents a requirement for a modifier (in SubjectRequirements)."""
-    _name: str = "Requirement"
+    _name = "Requirement"
     type_: Optional[str] = None  # Renamed to avoid conflict with builtin
-    arguments: list[dict] = []
+    arguments: list[dict] = Field(default_factory=list)
     
     def to_xml_element(self) -> dict | None:
         """Generate Requirement XML with nested Arguments."""
         if not self.type_:
             return None
-        
-        # Build argument elements
-        arg_elements = []
-        for arg in self.arguments:
-            if isinstance(arg, dict) and 'name' in arg:
-                arg_elements.append({
-                    '_name': 'Argument',
-                    '_attrs': {'name': arg['name']},
-                    '_content': str(arg.get('value', ''))
-                })
-        
-        return {
-            '_name': 'Requirement',
-            '_attrs': {'type': self.type_},
-            '_content': arg_elements if arg_elements else None
-        }
+        return _requirement_xml(self.type_, self.arguments)
 
 
 class ModifierNode(BaseNode):
     """Represents a complete game modifier with nested requirements and arguments."""
-    _name: str = "Modifier"
+    _name = "Modifier"
     id: Optional[str] = None
     collection: Optional[str] = None
     effect: Optional[str] = None
     permanent: Optional[bool] = None
     run_once: Optional[bool] = None
-    requirements: list[dict] = []
-    arguments: list[dict] = []
-    strings: list[dict] = []
+    requirements: list[dict] = Field(default_factory=list)
+    arguments: list[dict] = Field(default_factory=list)
+    strings: list[dict] = Field(default_factory=list)
     
     def to_xml_element(self) -> dict | None:
         """Generate Modifier XML with all nested elements."""
@@ -295,15 +332,12 @@ class ModifierNode(BaseNode):
         
         # Add SubjectRequirements if present
         if self.requirements:
-            req_elements = []
-            for req in self.requirements:
-                if isinstance(req, dict) and 'type' in req:
-                    req_node = ModifierRequirementNode()
-                    req_node.type_ = req['type']
-                    req_node.arguments = req.get('arguments', [])
-                    req_elem = req_node.to_xml_element()
-                    if req_elem:
-                        req_elements.append(req_elem)
+            # Built directly from the dicts (no ModifierRequirementNode each)
+            req_elements = [
+                _requirement_xml(req['type'], req.get('arguments', []))
+                for req in self.requirements
+                if isinstance(req, dict) and 'type' in req and req['type']
+            ]
             
             if req_elements:
                 content.append({
@@ -312,22 +346,18 @@ class ModifierNode(BaseNode):
                 })
         
         # Add Arguments
-        for arg in self.arguments:
-            if isinstance(arg, dict) and 'name' in arg:
-                content.append({
-                    '_name': 'Argument',
-                    '_attrs': {'name': arg['name']},
-                    '_content': str(arg.get('value', ''))
-                })
+        content += [
+            _argument_xml(arg)
+            for arg in self.arguments
+            if isinstance(arg, dict) and 'name' in arg
+        ]
         
         # Add Strings
-        for string in self.strings:
-            if isinstance(string, dict) and 'context' in string:
-                content.append({
-                    '_name': 'String',
-                    '_attrs': {'context': string['context']},
-                    '_content': str(string.get('value', ''))
-                })
+        content += [
+            _string_xml(string)
+            for string in self.strings
+            if isinstance(string, dict) and 'context' in string
+        ]
         
         return {
             '_name': 'Modifier',
@@ -338,8 +368,8 @@ class ModifierNode(BaseNode):
 
 class GameEffectNode(BaseNode):
     """Represents the GameEffects root element containing modifiers."""
-    _name: str = "GameEffects"
-    modifiers: list[ModifierNode] = []
+    _name = "GameEffects"
+    modifiers: list[ModifierNode] = Field(default_factory=list)
     
     def to_xml_element(self) -> dict | None:
         """Generate GameEffects XML root element."""
@@ -364,14 +394,14 @@ class GameEffectNode(BaseNode):
 
 class RequirementNode(BaseNode):
     """Represents a requirement."""
-    _name: str = "Row"
+    _name = "Row"
     requirement_type: Optional[str] = None
 
 
 # Start Bias Nodes
 class StartBiasBiomeNode(BaseNode):
     """Represents a start bias for a biome."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     biome_type: Optional[str] = None
     bias_value: Optional[int] = None
@@ -379,7 +409,7 @@ class StartBiasBiomeNode(BaseNode):
 
 class StartBiasTerrainNode(BaseNode):
     """Represents a start bias for terrain."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     terrain_type: Optional[str] = None
     bias_value: Optional[int] = None
@@ -388,7 +418,7 @@ class StartBiasTerrainNode(BaseNode):
 # Visual Remap Nodes (special nested structure)
 class VisualRemapRowNode(BaseNode):
     """Represents a visual remap with nested elements."""
-    _name: str = "Row"
+    _name = "Row"
     id: Optional[str] = None
     display_name: Optional[str] = None
     kind: Optional[str] = None
@@ -421,8 +451,8 @@ class VisualRemapRowNode(BaseNode):
 
 class VisualRemapRootNode(BaseNode):
     """Root node for visual remaps."""
-    _name: str = "VisualRemaps"
-    rows: list[VisualRemapRowNode] = []
+    _name = "VisualRemaps"
+    rows: list[VisualRemapRowNode] = Field(default_factory=list)
     
     def to_xml_element(self) -> dict | None:
         """Generate VisualRemaps XML root."""
@@ -447,14 +477,14 @@ class VisualRemapRootNode(BaseNode):
 # Import/Visual Nodes
 class ImportNode(BaseNode):
     """Represents an imported resource."""
-    _name: str = "Row"
+    _name = "Row"
     import_type: Optional[str] = None
     source_file: Optional[str] = None
 
 
 class VisArtNode(BaseNode):
     """Represents visual art configuration."""
-    _name: str = "Row"
+    _name = "Row"
     art_id: Optional[str] = None
     culture_type: Optional[str] = None
     path: Optional[str] = None
@@ -462,14 +492,14 @@ class VisArtNode(BaseNode):
 
 class ProgressionTreePrereqNode(BaseNode):
     """Represents a prerequisite for a progression tree node."""
-    _name: str = "Row"
+    _name = "Row"
     node: Optional[str] = None
     prereq_node: Optional[str] = None
 
 
 class TraditionNode(BaseNode):
     """Represents a cultural tradition."""
-    _name: str = "Row"
+    _name = "Row"
     tradition_type: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
@@ -481,7 +511,7 @@ class TraditionNode(BaseNode):
 
 class GreatPersonNode(BaseNode):
     """Represents a great person unit definition."""
-    _name: str = "Row"
+    _name = "Row"
     great_person_type: Optional[str] = None
     great_person_class: Optional[str] = None
     base_unit_type: Optional[str] = None
@@ -489,7 +519,7 @@ class GreatPersonNode(BaseNode):
 
 class NamedPlaceNode(BaseNode):
     """Represents a named place location with regional effects."""
-    _name: str = "Row"
+    _name = "Row"
     named_place_type: Optional[str] = None
     placement: Optional[str] = None
     name: Optional[str] = None
@@ -498,35 +528,35 @@ class NamedPlaceNode(BaseNode):
 
 class NamedRiverNode(BaseNode):
     """Represents a named river definition."""
-    _name: str = "Row"
+    _name = "Row"
     named_river_type: Optional[str] = None
     name: Optional[str] = None
 
 
 class NamedVolcanoNode(BaseNode):
     """Represents a named volcano definition."""
-    _name: str = "Row"
+    _name = "Row"
     named_volcano_type: Optional[str] = None
     name: Optional[str] = None
 
 
 class NamedRiverCivilizationNode(BaseNode):
     """Links a named river to a civilization."""
-    _name: str = "Row"
+    _name = "Row"
     named_river_type: Optional[str] = None
     civilization_type: Optional[str] = None
 
 
 class NamedVolcanoCivilizationNode(BaseNode):
     """Links a named volcano to a civilization."""
-    _name: str = "Row"
+    _name = "Row"
     named_volcano_type: Optional[str] = None
     civilization_type: Optional[str] = None
 
 
 class UnitTierVariantNode(BaseNode):
     """Represents a unit tier variant (e.g., Veteran, Elite)."""
-    _name: str = "Row"
+    _name = "Row"
     unit_type: Optional[str] = None
     tier: Optional[int] = None
     combat_bonus: Optional[int] = None
@@ -535,7 +565,7 @@ class UnitTierVariantNode(BaseNode):
 
 class AdjacencyBonusNode(BaseNode):
     """Represents a custom adjacency bonus for buildings."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     adjacency_type: Optional[str] = None
     yield_type: Optional[str] = None
@@ -545,7 +575,7 @@ class AdjacencyBonusNode(BaseNode):
 
 class MultiTileBuildingNode(BaseNode):
     """Represents a multi-tile building/quarter component."""
-    _name: str = "Row"
+    _name = "Row"
     constructible_type: Optional[str] = None
     component_building_type: Optional[str] = None
     layout: Optional[str] = None
@@ -554,7 +584,7 @@ class MultiTileBuildingNode(BaseNode):
 
 class UniqueQuarterNode(BaseNode):
     """Represents a district-specific unique quarter building."""
-    _name: str = "Row"
+    _name = "Row"
     unique_quarter_type: Optional[str] = None
     building_type_1: Optional[str] = None
     building_type_2: Optional[str] = None
@@ -565,7 +595,7 @@ class UniqueQuarterNode(BaseNode):
 
 class LeaderUnlockNode(BaseNode):
     """Represents a leader unlock configuration."""
-    _name: str = "Row"
+    _name = "Row"
     leader_unlock_type: Optional[str] = None
     leader_type: Optional[str] = None
     civilization_type: Optional[str] = None
@@ -577,14 +607,14 @@ class LeaderUnlockNode(BaseNode):
 
 class StartBiasAdjacentToCoastNode(BaseNode):
     """Represents coast adjacency preference for civilization start bias."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     bias: Optional[int] = None
 
 
 class StartBiasFeatureClassNode(BaseNode):
     """Represents feature class preference for civilization start bias."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     feature_class: Optional[str] = None
     bias: Optional[int] = None
@@ -592,7 +622,7 @@ class StartBiasFeatureClassNode(BaseNode):
 
 class StartBiasRiverNode(BaseNode):
     """Represents river preference for civilization start bias."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     bias: Optional[int] = None
 
@@ -602,14 +632,14 @@ class StartBiasRiverNode(BaseNode):
 
 class UnitReplaceNode(BaseNode):
     """Represents a unit replacement configuration."""
-    _name: str = "Row"
+    _name = "Row"
     civ_unique_unit_type: Optional[str] = None
     replaces_unit_type: Optional[str] = None
 
 
 class VisArtCivilizationBuildingCultureNode(BaseNode):
     """Represents visual art configuration for civilization building culture."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     building_culture_type: Optional[str] = None
     visual_parent_type: Optional[str] = None
@@ -617,7 +647,7 @@ class VisArtCivilizationBuildingCultureNode(BaseNode):
 
 class VisArtCivilizationUnitCultureNode(BaseNode):
     """Represents visual art configuration for civilization unit culture."""
-    _name: str = "Row"
+    _name = "Row"
     civilization_type: Optional[str] = None
     unit_culture_type: Optional[str] = None
     visual_parent_type: Optional[str] = None
@@ -15,26 +15,100 @@ Scans XML files to harvest valid values for:
 Output: JSON files in src/civ7_modding_tools/data/ with kebab-case naming.
 """
 
+import io
 import json
+import os
 import re
+import sys
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterator, List, Set, Tuple, Union
 import xml.etree.ElementTree as ET
 
 
+# Attributes whose values are collected unchanged into a set in
+# CivVIIDataExtractor.data: attribute name -> data key
+_SET_ATTRIBUTES = {
+    'TerrainType': 'terrain_types',
+    'DistrictType': 'district_types',
+    'YieldType': 'yield_types',
+    'AdvisoryClassType': 'advisory_class_types',
+    'ConstructibleClass': 'constructible_classes',
+    'UnitMovementClass': 'unit_movement_classes',
+    'CoreClass': 'core_classes',
+    'FormationClass': 'formation_classes',
+    'Domain': 'domains',
+    'MilitaryDomain': 'military_domains',
+    'CostProgressionModel': 'cost_progression_models',
+    'BiomeType': 'biome_types',
+    'FeatureType': 'feature_types',
+    'RiverPlacement': 'river_placements',
+    'Age': 'ages',
+    'PromotionClass': 'promotion_classes',
+    'GovernmentType': 'government_types',
+    'ProjectType': 'project_types',
+    'BeliefClassType': 'belief_class_types',
+    'DifficultyType': 'difficulty_types',
+    'ProgressionTree': 'progression_trees',
+    'HandicapSystemType': 'handicap_system_types',
+}
+
+
+# Attributes, besides those in _SET_ATTRIBUTES, that some rule in
+# _extract_from_file needs an element to carry before it can match
+_RULE_ATTRIBUTES = (
+    'BuildingCulture', 'UnitCulture', 'effect', 'type', 'collection', 'Tag',
+    'domain', 'Type', 'ConstructibleType', 'UnitAbilityType',
+    'ProgressionTreeNodeType', 'TraditionType', 'CivUniqueUnitType', 'Leader',
+    'TraitType', 'CivilizationType', 'ProgressionTreeType',
+)
+
+# Raw-bytes check for whether a file assigns any attribute a rule reads;
+# files without a match cannot contribute data and are not parsed
+_RULE_ATTRIBUTE_RE = re.compile(
+    rb'(?<![\w:.-])(?:'
+    + b'|'.join(re.escape(key.encode()) for key in (*_SET_ATTRIBUTES, *_RULE_ATTRIBUTES))
+    + rb')\s*='
+)
+
+
+# Civilization folder name -> CivilizationType, in match priority order
+_CIV_FOLDERS = tuple(
+    (folder, f"CIVILIZATION_{folder.upper().replace('-', '_')}")
+    for folder in ('babylon', 'assyria', 'bulgaria', 'carthage', 'dal-viet',
+                   'great-britain', 'iceland', 'nepal', 'ottomans',
+                   'pirate-republic', 'qajar', 'tonga')
+)
+
+
+@lru_cache(maxsize=4096)
+def _civ_name_from_parts(parts: Tuple[str, ...]) -> str | None:
+    """Return the civilization named by the first matching path part, if any."""
+    for part in parts:
+        if part.startswith('CIVILIZATION_'):
+            return part
+        # Match civilization folders like 'babylon', 'assyria', etc.
+        part_lower = part.lower()
+        for folder, civ_type in _CIV_FOLDERS:
+            if folder in part_lower:
+                return civ_type
+    return None
+
+
 class CivVIIDataExtractor:
     """Extract reference values from Civ VII mod files."""
 
     def __init__(self, root_dir: Path, game_install_dir: Path = None):
         self.root = root_dir
         self.game_install_dir = game_install_dir
-        self.data = {
+        self.data: Dict[str, Any] = {
             # Original requested types
-            'building_cultures': defaultdict(set),
-            'building_cultures_by_era': defaultdict(lambda: defaultdict(set)),
+            # Culture maps are filled once per file, via setdefault
+            'building_cultures': {},  # {culture: {civ}}
+            'building_cultures_by_era': {},  # {culture: {era: {civ}}}
             'terrain_types': set(),
-            'unit_cultures': defaultdict(set),
+            'unit_cultures': {},  # {culture: {civ}}
             'effects': set(),
             'civilization_domains': set(),
             'tags': defaultdict(str),
@@ -109,28 +183,35 @@ class CivVIIDataExtractor:
         # Resolve LOC_ keys to English text for traditions
         self._resolve_tradition_localizations()
 
+    @staticmethod
+    def _iter_xml_files(directory: Union[Path, str]) -> Iterator[Path]:
+        """
+        Yield the XML files under a directory, like rglob('*.xml').
+        
+        Walks with os.scandir, using the directory entries' cached type
+        information, and only builds Path objects for XML files. Each
+        directory's files come first, then its subdirectories depth-first;
+        symlinked directories are not followed.
+        """
+        with os.scandir(directory) as it:
+            entries = list(it)
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif os.path.normcase(entry.name).endswith('.xml'):
+                yield Path(entry.path)
+        for subdirectory in subdirectories:
+            yield from CivVIIDataExtractor._iter_xml_files(subdirectory)
+
     def _scan_directory(self, directory: Path, is_example: bool = False) -> None:
         """Scan a directory for XML files."""
-        for xml_file in directory.rglob('*.xml'):
+        for xml_file in self._iter_xml_files(directory):
             try:
                 self._extract_from_file(xml_file)
             except Exception as e:
-                print(f"Warning: Failed to parse {xml_file}: {e}")    
-    def _extract_english_text(self, file_path: Path) -> None:
-        """Extract English localization text from EnglishText or LocalizedText nodes."""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-        except ET.ParseError:
-            return
-        
-        # EnglishText format (used in text/en_us/ and modules/text/)
-        for row in root.findall(".//EnglishText/Row"):
-            tag = row.get('Tag')
-            text_elem = row.find('Text')
-            if tag and text_elem is not None and text_elem.text:
-                self.localization_texts[tag] = text_elem.text
-    
+                print(f"Warning: Failed to parse {xml_file}: {e}")
+
     def _resolve_ability_descriptions(self) -> None:
         """Resolve LOC_ description keys to actual English text."""
         for ability_id, ability_data in self.data['unit_abilities'].items():
@@ -192,14 +273,8 @@ class CivVIIDataExtractor:
             author_loc = quote_data.get('quote_author_loc', '')
             if author_loc and author_loc in self.localization_texts:
                 quote_data['quote_author'] = self.localization_texts[author_loc]
-    def _extract_english_text(self, file_path: Path) -> None:
+    def _extract_english_text(self, root: ET.Element) -> None:
         """Extract English localization text from EnglishText or LocalizedText nodes."""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-        except ET.ParseError:
-            return
-        
         # EnglishText format (used in text/en_us/ and modules/text/)
         for row in root.findall(".//EnglishText/Row"):
             tag = row.get('Tag')
@@ -207,14 +282,8 @@ class CivVIIDataExtractor:
             if tag and text_elem is not None and text_elem.text:
                 self.localization_texts[tag] = text_elem.text
 
-    def _extract_modifiers_from_file(self, file_path: Path) -> None:
+    def _extract_modifiers_from_file(self, root: ET.Element) -> None:
         """Extract modifiers with full metadata including arguments and descriptions."""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-        except ET.ParseError:
-            return
-        
         # Handle XML namespaces - GameEffects files use xmlns="GameEffects"
         namespace = ''
         if '}' in root.tag:
@@ -274,22 +343,67 @@ class CivVIIDataExtractor:
                 if string_elem.get('context') == 'Description':
                     self.data['modifiers'][modifier_id]['description_loc'] = string_elem.text or ''
     
-    def _extract_from_file(self, file_path: Path) -> None:
-        """Extract values from a single XML file."""
+    @staticmethod
+    def _iter_elements(source: IO[bytes]) -> Iterator[ET.Element]:
+        """
+        Yield a document's elements in document order without keeping its tree.
+        
+        Elements are yielded when their start tag (with attributes) is read.
+        At their end tag they are cleared and detached from their parent, so
+        memory follows nesting depth rather than file size. Iteration stops
+        quietly at a parse error.
+        """
+        # Open elements, innermost last; a finished element is always the
+        # only child left on its parent, so removing it is cheap
+        stack: list[ET.Element] = []
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            for event, element in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(element)
+                    yield element
+                else:
+                    stack.pop()
+                    element.clear()
+                    if stack:
+                        stack[-1].remove(element)
         except ET.ParseError:
             return
+
+    def _extract_from_file(self, file_path: Path) -> None:
+        """Extract values from a single XML file."""
+        file_path_str = str(file_path).lower()
+        is_text = 'text' in file_path_str or 'localization' in file_path_str
+        is_game_effects = 'gameeffects' in file_path_str
         
-        # Extract English text if this is a localization file
-        if 'text' in str(file_path).lower() or 'localization' in str(file_path).lower():
-            self._extract_english_text(file_path)
+        # Read the file once; both parse paths below work from these bytes.
+        # Empty files hold no document: skip them rather than letting the
+        # parser raise for each one
+        raw = file_path.read_bytes()
+        if not raw or raw.isspace():
+            return
         
-        # Extract modifiers from GameEffects files
-        file_path_str = str(file_path).lower()
-        if 'gameeffects' in file_path_str:
-            self._extract_modifiers_from_file(file_path)
+        elements: Iterator[ET.Element]
+        if is_text or is_game_effects:
+            # The text and modifier helpers query the whole tree
+            try:
+                root = ET.fromstring(raw)
+            except ET.ParseError:
+                return
+            
+            # Extract English text if this is a localization file
+            if is_text:
+                self._extract_english_text(root)
+            
+            # Extract modifiers from GameEffects files
+            if is_game_effects:
+                self._extract_modifiers_from_file(root)
+            elements = root.iter()
+        else:
+            # Only tags and attributes are read below: skip files that set
+            # none of the attributes the rules look at, and stream the rest
+            if not _RULE_ATTRIBUTE_RE.search(raw):
+                return
+            elements = self._iter_elements(io.BytesIO(raw))
 
         # Get civilization name from folder structure if available
         civ_name = self._get_civ_name_from_path(file_path)
@@ -316,150 +430,87 @@ class CivVIIDataExtractor:
                 # Generic 'data-EXAMPLE' folder implies Antiquity
                 era_id = 'AGE_ANTIQUITY'
 
-        # Handle XML namespaces
-        namespaces = {}
-        if '}' in root.tag:
-            namespace = root.tag.split('}')[0] + '}'
-            namespaces['ns'] = namespace[1:-1]
+        # Bind the data containers once per file rather than looking them
+        # up through self on every matching element
+        data = self.data
+        traditions = data['traditions']
+        unit_abilities = data['unit_abilities']
+
+        # One dict probe per attribute present, rather than one membership
+        # test per known attribute
+        set_adders = {
+            key: data[name].add for key, name in _SET_ATTRIBUTES.items()
+        }
+
+        # Culture values seen in this file, credited to civ_name (and era)
+        # once each after the scan instead of on every row
+        file_building_cultures = set()
+        file_unit_cultures = set()
 
         # Scan for each data type
-        for element in root.iter():
+        for element in elements:
+            attribs = element.attrib
+            # Every check below reads an attribute: skip bare elements
+            # (Database, table wrappers, Text, ...) before any dispatch
+            if not attribs:
+                continue
+            
+            for key, value in attribs.items():
+                add = set_adders.get(key)
+                if add is not None:
+                    add(value)
+            
             tag = element.tag
             # Strip namespace from tag
             if '}' in tag:
                 tag = tag.split('}')[1]
-            
-            attribs = element.attrib
 
             # BuildingCulture - track by era
-            if 'BuildingCulture' in attribs:
-                bc = attribs['BuildingCulture']
-                self.data['building_cultures'][bc].add(civ_name)
-                # Also track with era if available
-                if era_id:
-                    self.data['building_cultures_by_era'][bc][era_id].add(civ_name)
+            bc = attribs.get('BuildingCulture')
+            if bc is not None:
+                file_building_cultures.add(bc)
 
             # UnitCulture
-            if 'UnitCulture' in attribs:
-                uc = attribs['UnitCulture']
-                self.data['unit_cultures'][uc].add(civ_name)
-
-            # TerrainType
-            if 'TerrainType' in attribs:
-                self.data['terrain_types'].add(attribs['TerrainType'])
-
-            # DistrictType
-            if 'DistrictType' in attribs:
-                self.data['district_types'].add(attribs['DistrictType'])
-
-            # YieldType
-            if 'YieldType' in attribs:
-                self.data['yield_types'].add(attribs['YieldType'])
-
-            # AdvisoryClassType
-            if 'AdvisoryClassType' in attribs:
-                self.data['advisory_class_types'].add(attribs['AdvisoryClassType'])
+            uc = attribs.get('UnitCulture')
+            if uc is not None:
+                file_unit_cultures.add(uc)
 
             # effect (from Modifier elements)
             if tag == 'Modifier' and 'effect' in attribs:
-                self.data['effects'].add(attribs['effect'])
+                data['effects'].add(attribs['effect'])
 
             # Requirements
-            if 'type' in attribs and attribs.get('type', '').startswith('REQUIREMENT_'):
-                self.data['requirement_types'].add(attribs['type'])
+            requirement_type = attribs.get('type')
+            if requirement_type is not None and requirement_type.startswith('REQUIREMENT_'):
+                data['requirement_types'].add(requirement_type)
 
             # Collections
-            if 'collection' in attribs and attribs.get('collection', '').startswith('COLLECTION_'):
-                self.data['collection_types'].add(attribs['collection'])
+            collection = attribs.get('collection')
+            if collection is not None and collection.startswith('COLLECTION_'):
+                data['collection_types'].add(collection)
 
             # Tags and Categories
             if tag == 'Row' and 'Tag' in attribs:
-                category = attribs.get('Category', 'UNCATEGORIZED')
-                self.data['tags'][attribs['Tag']] = category
+                # Categories repeat across thousands of rows: keep one
+                # string object per category instead of one per row
+                category = sys.intern(attribs.get('Category', 'UNCATEGORIZED'))
+                data['tags'][attribs['Tag']] = category
 
             # CivilizationDomain (often in shell-scoped files with domain attribute)
             if 'domain' in attribs and 'Civilization' in attribs:
-                self.data['civilization_domains'].add(attribs['domain'])
+                data['civilization_domains'].add(attribs['domain'])
 
             # Additional types from constructibles, units, etc.
             
-            # ConstructibleClass
-            if 'ConstructibleClass' in attribs:
-                self.data['constructible_classes'].add(attribs['ConstructibleClass'])
-            
-            # UnitMovementClass
-            if 'UnitMovementClass' in attribs:
-                self.data['unit_movement_classes'].add(attribs['UnitMovementClass'])
-            
-            # CoreClass
-            if 'CoreClass' in attribs:
-                self.data['core_classes'].add(attribs['CoreClass'])
-            
-            # FormationClass
-            if 'FormationClass' in attribs:
-                self.data['formation_classes'].add(attribs['FormationClass'])
-            
-            # Domain
-            if 'Domain' in attribs:
-                self.data['domains'].add(attribs['Domain'])
-            
-            # MilitaryDomain
-            if 'MilitaryDomain' in attribs:
-                self.data['military_domains'].add(attribs['MilitaryDomain'])
-            
-            # CostProgressionModel
-            if 'CostProgressionModel' in attribs:
-                self.data['cost_progression_models'].add(attribs['CostProgressionModel'])
-            
-            # BiomeType
-            if 'BiomeType' in attribs:
-                self.data['biome_types'].add(attribs['BiomeType'])
-            
-            # FeatureType
-            if 'FeatureType' in attribs:
-                self.data['feature_types'].add(attribs['FeatureType'])
-            
-            # RiverPlacement
-            if 'RiverPlacement' in attribs:
-                self.data['river_placements'].add(attribs['RiverPlacement'])
-            
-            # Age
-            if 'Age' in attribs:
-                self.data['ages'].add(attribs['Age'])
-            
-            # PromotionClass
-            if 'PromotionClass' in attribs:
-                self.data['promotion_classes'].add(attribs['PromotionClass'])
-            
-            # GovernmentType
-            if 'GovernmentType' in attribs:
-                self.data['government_types'].add(attribs['GovernmentType'])
-            
-            # ProjectType
-            if 'ProjectType' in attribs:
-                self.data['project_types'].add(attribs['ProjectType'])
-            
-            # BeliefClassType
-            if 'BeliefClassType' in attribs:
-                self.data['belief_class_types'].add(attribs['BeliefClassType'])
-            
-            # DifficultyType
-            if 'DifficultyType' in attribs:
-                self.data['difficulty_types'].add(attribs['DifficultyType'])
-            
-            # ProgressionTree
-            if 'ProgressionTree' in attribs:
-                self.data['progression_trees'].add(attribs['ProgressionTree'])
-            
             # GreatWorkObjectType - from Type Kind
             if tag == 'Row' and 'Type' in attribs and 'Kind' in attribs:
                 if attribs['Kind'] == 'KIND_GREATWORKOBJECT':
-                    self.data['great_work_object_types'].add(attribs['Type'])
+                    data['great_work_object_types'].add(attribs['Type'])
             
             # Unit - from Type Kind
             if tag == 'Row' and 'Type' in attribs and 'Kind' in attribs:
                 if attribs['Kind'] == 'KIND_UNIT':
-                    self.data['units'].add(attribs['Type'])
+                    data['units'].add(attribs['Type'])
             
             # Constructibles - from ConstructibleType attribute
             if 'ConstructibleType' in attribs:
@@ -467,7 +518,7 @@ class CivVIIDataExtractor:
                 if (constructible_type.startswith('BUILDING_') or 
                     constructible_type.startswith('IMPROVEMENT_') or 
                     constructible_type.startswith('WONDER_')):
-                    self.data['constructibles'].add(constructible_type)
+                    data['constructibles'].add(constructible_type)
             
             # UnitAbilities - extract ability types from UnitAbilityType attribute
             # This captures abilities from UnitAbilities, UnitClass_Abilities, and UnitAbilityModifiers tables
@@ -478,14 +529,14 @@ class CivVIIDataExtractor:
                     if 'Name' in attribs and 'Description' in attribs:
                         loc_description = attribs.get('Description', '')
                         # Resolve LOC_ key to English text (will be done in finalize phase)
-                        self.data['unit_abilities'][ability_type] = {
+                        unit_abilities[ability_type] = {
                             'name': attribs.get('Name', ''),
                             'description': loc_description,
                             'description_text': ''  # Will be resolved later
                         }
                     # Otherwise just ensure the ability exists in the dict
-                    elif ability_type not in self.data['unit_abilities']:
-                        self.data['unit_abilities'][ability_type] = {'name': '', 'description': '', 'description_text': ''}
+                    elif ability_type not in unit_abilities:
+                        unit_abilities[ability_type] = {'name': '', 'description': '', 'description_text': ''}
             
             # Track units unlocked by progression tree nodes (for age mapping)
             # ProgressionTreeNodeUnlocks table maps progression nodes to units
@@ -505,11 +556,11 @@ class CivVIIDataExtractor:
                     self._infer_node_age_from_name(node_type)
                 
                 # Track tradition unlocks - create placeholder entries for traditions we don't have full data for
-                if target_kind == 'KIND_TRADITION' and target_type and target_type not in self.data['traditions']:
+                if target_kind == 'KIND_TRADITION' and target_type and target_type not in traditions:
                     # Infer age and trait from node name
                     node_age = self._infer_age_from_node_name(node_type) or era_id or 'AGE_ANTIQUITY'
                     trait_type = self._infer_trait_from_node_name(node_type)
-                    self.data['traditions'][target_type] = {
+                    traditions[target_type] = {
                         'name_loc': '',
                         'description_loc': '',
                         'is_crisis': False,
@@ -531,7 +582,7 @@ class CivVIIDataExtractor:
                     trait_type = attribs.get('TraitType', '')
                     
                     # Store tradition data
-                    self.data['traditions'][tradition_type] = {
+                    traditions[tradition_type] = {
                         'name_loc': name_loc,
                         'description_loc': desc_loc,
                         'is_crisis': is_crisis,
@@ -545,7 +596,7 @@ class CivVIIDataExtractor:
                 node_type = attribs['Type']
                 # Only extract quotes for progression tree nodes
                 if 'NODE_' in node_type or 'TREE_' in node_type:
-                    self.data['quotes'][node_type] = {
+                    data['quotes'][node_type] = {
                         'quote_loc': attribs.get('Quote', ''),
                         'quote_author_loc': attribs.get('QuoteAuthor', ''),
                         'quote_audio': attribs.get('QuoteAudio', ''),
@@ -559,12 +610,12 @@ class CivVIIDataExtractor:
                 tradition_type = attribs['TraditionType']
                 modifier_id = attribs['ModifierId']
                 # Add modifier to tradition if it exists
-                if tradition_type in self.data['traditions']:
-                    self.data['traditions'][tradition_type]['modifiers'].append(modifier_id)
+                if tradition_type in traditions:
+                    traditions[tradition_type]['modifiers'].append(modifier_id)
                 # Otherwise create a placeholder (modifier-only reference)
                 elif not any(k in attribs for k in ['Name', 'Description']):
-                    if tradition_type not in self.data['traditions']:
-                        self.data['traditions'][tradition_type] = {
+                    if tradition_type not in traditions:
+                        traditions[tradition_type] = {
                             'name_loc': '',
                             'description_loc': '',
                             'is_crisis': False,
@@ -573,7 +624,7 @@ class CivVIIDataExtractor:
                             'modifiers': [modifier_id]
                         }
                     else:
-                        self.data['traditions'][tradition_type]['modifiers'].append(modifier_id)
+                        traditions[tradition_type]['modifiers'].append(modifier_id)
 
             # UnitReplaces - extract unit replacement mappings
             if tag == 'Row' and 'CivUniqueUnitType' in attribs and 'ReplacesUnitType' in attribs:
@@ -587,21 +638,17 @@ class CivVIIDataExtractor:
                     resource_type = attribs['Type']
                     # Try to infer class from naming patterns
                     if 'STRATEGIC' in resource_type:
-                        self.data['resource_classes'].add('RESOURCE_CLASS_STRATEGIC')
+                        data['resource_classes'].add('RESOURCE_CLASS_STRATEGIC')
                     elif 'LUXURY' in resource_type:
-                        self.data['resource_classes'].add('RESOURCE_CLASS_LUXURY')
+                        data['resource_classes'].add('RESOURCE_CLASS_LUXURY')
                     elif 'BONUS' in resource_type:
-                        self.data['resource_classes'].add('RESOURCE_CLASS_BONUS')
+                        data['resource_classes'].add('RESOURCE_CLASS_BONUS')
             
-            # HandicapSystemType
-            if 'HandicapSystemType' in attribs:
-                self.data['handicap_system_types'].add(attribs['HandicapSystemType'])
-
             # Leader - from LeaderCivPriorities and similar tables
             if 'Leader' in attribs:
                 leader = attribs['Leader']
                 if leader.startswith('LEADER_'):
-                    self.data['leaders'].add(leader)
+                    data['leaders'].add(leader)
             
             # TraitType - extract civilization traits (TRAIT_ATTRIBUTE_* and *_CIV variants)
             if tag == 'Row' and 'TraitType' in attribs:
@@ -610,17 +657,17 @@ class CivVIIDataExtractor:
                 if (trait.startswith('TRAIT_ATTRIBUTE_') or 
                     trait.endswith('_CIV') or
                     'ABILITY' in trait):
-                    self.data['civilization_traits'].add(trait)
+                    data['civilization_traits'].add(trait)
                 # Separate leader attributes for dedicated collection
                 if 'TRAIT_LEADER_ATTRIBUTE_' in trait:
-                    self.data['leader_attributes'].add(trait)
+                    data['leader_attributes'].add(trait)
 
             # Civilization - ONLY from Civilizations table with UniqueCultureProgressionTree
             # This filters out unlock references to DLC/unreleased content
             if tag == 'Row' and 'CivilizationType' in attribs and 'UniqueCultureProgressionTree' in attribs:
                 civ_type = attribs['CivilizationType']
                 if civ_type.startswith('CIVILIZATION_'):
-                    self.data['civilizations'].add(civ_type)
+                    data['civilizations'].add(civ_type)
                     # Capture UniqueCultureProgressionTree to map age
                     tree_id = attribs['UniqueCultureProgressionTree']
                     self.civilization_ages[civ_type] = tree_id
@@ -642,19 +689,23 @@ class CivVIIDataExtractor:
                 # Infer age from node name pattern (e.g., NODE_TECH_AQ_AGRICULTURE)
                 self._infer_node_age_from_name(node_type)
 
+        building_cultures = data['building_cultures']
+        building_cultures_by_era = data['building_cultures_by_era']
+        for bc in file_building_cultures:
+            building_cultures.setdefault(bc, set()).add(civ_name)
+            # Also track with era if available
+            if era_id:
+                building_cultures_by_era.setdefault(bc, {}).setdefault(era_id, set()).add(civ_name)
+        unit_cultures = data['unit_cultures']
+        for uc in file_unit_cultures:
+            unit_cultures.setdefault(uc, set()).add(civ_name)
+
     def _get_civ_name_from_path(self, file_path: Path) -> str:
         """Extract civilization name from file path."""
+        # Files in one folder share its answer: look the folder up through
+        # the cache, and only fall back to the file name itself
         parts = file_path.parts
-        for part in parts:
-            if part.startswith('CIVILIZATION_'):
-                return part
-            # Match civilization folders like 'babylon', 'assyria', etc.
-            for potential_civ in ['babylon', 'assyria', 'bulgaria', 'carthage', 'dal-viet',
-                                   'great-britain', 'iceland', 'nepal', 'ottomans',
-                                   'pirate-republic', 'qajar', 'tonga']:
-                if potential_civ in part.lower():
-                    return f"CIVILIZATION_{potential_civ.upper().replace('-', '_')}"
-        return 'UNKNOWN'
+        return _civ_name_from_parts(parts[:-1]) or _civ_name_from_parts(parts[-1:]) or 'UNKNOWN'
 
     def _resolve_civ_age(self, civ_id: str) -> str:
         """Resolve civilization age from progression tree."""
@@ -756,16 +807,21 @@ class CivVIIDataExtractor:
 
         # Convert sets to lists for JSON serialization
         if isinstance(data, dict):
-            data = {k: sorted(list(v)) if isinstance(v, set) else v
+            data = {k: sorted(v) if isinstance(v, set) else v
                     for k, v in data.items()}
         elif isinstance(data, set):
-            data = sorted(list(data))
+            data = sorted(data)
 
+        # Encode in one go and write once: json.dump with indent would
+        # issue a write per encoded fragment
         output_file = output_dir / filename
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        output_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
         print(f"[OK] Written {output_file}")
 
+    def _write_id_list(self, filename: str, values: Set[str]) -> None:
+        """Write values as a sorted {'values': [{'id': ...}, ...]} JSON file."""
+        self._write_json(filename, {'values': [{'id': value} for value in sorted(values)]})
+
     def _guess_name(self, id_str: str) -> str:
         """Guess a human-readable name from the ID."""
         mappings = {
@@ -911,46 +967,25 @@ class CivVIIDataExtractor:
         self._write_json('unit-cultures.json', unit_cultures)
 
         # TerrainType
-        terrain_types = {
-            'values': [{'id': tt} for tt in sorted(self.data['terrain_types'])]
-        }
-        self._write_json('terrain-types.json', terrain_types)
+        self._write_id_list('terrain-types.json', self.data['terrain_types'])
 
         # DistrictType
-        district_types = {
-            'values': [{'id': dt} for dt in sorted(self.data['district_types'])]
-        }
-        self._write_json('district-types.json', district_types)
+        self._write_id_list('district-types.json', self.data['district_types'])
 
         # YieldType
-        yield_types = {
-            'values': [{'id': yt} for yt in sorted(self.data['yield_types'])]
-        }
-        self._write_json('yield-types.json', yield_types)
+        self._write_id_list('yield-types.json', self.data['yield_types'])
 
         # AdvisoryClassType
-        advisory_types = {
-            'values': [{'id': act} for act in sorted(self.data['advisory_class_types'])]
-        }
-        self._write_json('advisory-class-types.json', advisory_types)
+        self._write_id_list('advisory-class-types.json', self.data['advisory_class_types'])
 
         # Effects
-        effects = {
-            'values': [{'id': e} for e in sorted(self.data['effects'])]
-        }
-        self._write_json('effects.json', effects)
+        self._write_id_list('effects.json', self.data['effects'])
 
         # Requirements
-        requirements = {
-            'values': [{'id': r} for r in sorted(self.data['requirement_types'])]
-        }
-        self._write_json('requirement-types.json', requirements)
+        self._write_id_list('requirement-types.json', self.data['requirement_types'])
 
         # Collections
-        collections = {
-            'values': [{'id': c} for c in sorted(self.data['collection_types'])]
-        }
-        self._write_json('collection-types.json', collections)
+        self._write_id_list('collection-types.json', self.data['collection_types'])
 
         # Tags
         tags = {
@@ -965,136 +1000,70 @@ class CivVIIDataExtractor:
         self._write_json('tags.json', tags)
 
         # CivilizationDomains
-        domains = {
-            'values': [{'id': d} for d in sorted(self.data['civilization_domains'])]
-        }
-        self._write_json('civilization-domains.json', domains)
+        self._write_id_list('civilization-domains.json', self.data['civilization_domains'])
 
         # ConstructibleClass
-        constructible_classes = {
-            'values': [{'id': cc} for cc in sorted(self.data['constructible_classes'])]
-        }
-        self._write_json('constructible-classes.json', constructible_classes)
+        self._write_id_list('constructible-classes.json', self.data['constructible_classes'])
 
         # UnitMovementClass
-        unit_movement_classes = {
-            'values': [{'id': umc} for umc in sorted(self.data['unit_movement_classes'])]
-        }
-        self._write_json('unit-movement-classes.json', unit_movement_classes)
+        self._write_id_list('unit-movement-classes.json', self.data['unit_movement_classes'])
 
         # CoreClass
-        core_classes = {
-            'values': [{'id': cc} for cc in sorted(self.data['core_classes'])]
-        }
-        self._write_json('core-classes.json', core_classes)
+        self._write_id_list('core-classes.json', self.data['core_classes'])
 
         # FormationClass
-        formation_classes = {
-            'values': [{'id': fc} for fc in sorted(self.data['formation_classes'])]
-        }
-        self._write_json('formation-classes.json', formation_classes)
+        self._write_id_list('formation-classes.json', self.data['formation_classes'])
 
         # Domain
-        domains_list = {
-            'values': [{'id': d} for d in sorted(self.data['domains'])]
-        }
-        self._write_json('domains.json', domains_list)
+        self._write_id_list('domains.json', self.data['domains'])
 
         # CostProgressionModel
-        cost_progression_models = {
-            'values': [{'id': cpm} for cpm in sorted(self.data['cost_progression_models'])]
-        }
-        self._write_json('cost-progression-models.json', cost_progression_models)
+        self._write_id_list('cost-progression-models.json', self.data['cost_progression_models'])
 
         # BiomeType
-        biome_types = {
-            'values': [{'id': bt} for bt in sorted(self.data['biome_types'])]
-        }
-        self._write_json('biome-types.json', biome_types)
+        self._write_id_list('biome-types.json', self.data['biome_types'])
 
         # FeatureType
-        feature_types = {
-            'values': [{'id': ft} for ft in sorted(self.data['feature_types'])]
-        }
-        self._write_json('feature-types.json', feature_types)
+        self._write_id_list('feature-types.json', self.data['feature_types'])
 
         # RiverPlacement
-        river_placements = {
-            'values': [{'id': rp} for rp in sorted(self.data['river_placements'])]
-        }
-        self._write_json('river-placements.json', river_placements)
+        self._write_id_list('river-placements.json', self.data['river_placements'])
 
         # Age
-        ages = {
-            'values': [{'id': a} for a in sorted(self.data['ages'])]
-        }
-        self._write_json('ages.json', ages)
+        self._write_id_list('ages.json', self.data['ages'])
 
         # MilitaryDomain
-        military_domains = {
-            'values': [{'id': md} for md in sorted(self.data['military_domains'])]
-        }
-        self._write_json('military-domains.json', military_domains)
+        self._write_id_list('military-domains.json', self.data['military_domains'])
 
         # PromotionClass
-        promotion_classes = {
-            'values': [{'id': pc} for pc in sorted(self.data['promotion_classes'])]
-        }
-        self._write_json('promotion-classes.json', promotion_classes)
+        self._write_id_list('promotion-classes.json', self.data['promotion_classes'])
 
         # GovernmentType
-        government_types = {
-            'values': [{'id': gt} for gt in sorted(self.data['government_types'])]
-        }
-        self._write_json('government-types.json', government_types)
+        self._write_id_list('government-types.json', self.data['government_types'])
 
         # ProjectType
-        project_types = {
-            'values': [{'id': pt} for pt in sorted(self.data['project_types'])]
-        }
-        self._write_json('project-types.json', project_types)
+        self._write_id_list('project-types.json', self.data['project_types'])
 
         # BeliefClassType
-        belief_class_types = {
-            'values': [{'id': bct} for bct in sorted(self.data['belief_class_types'])]
-        }
-        self._write_json('belief-class-types.json', belief_class_types)
+        self._write_id_list('belief-class-types.json', self.data['belief_class_types'])
 
         # DifficultyType
-        difficulty_types = {
-            'values': [{'id': dt} for dt in sorted(self.data['difficulty_types'])]
-        }
-        self._write_json('difficulty-types.json', difficulty_types)
+        self._write_id_list('difficulty-types.json', self.data['difficulty_types'])
 
         # ProgressionTree
-        progression_trees = {
-            'values': [{'id': pt} for pt in sorted(self.data['progression_trees'])]
-        }
-        self._write_json('progression-trees.json', progression_trees)
+        self._write_id_list('progression-trees.json', self.data['progression_trees'])
 
         # GreatWorkObjectType
-        great_work_object_types = {
-            'values': [{'id': gwot} for gwot in sorted(self.data['great_work_object_types'])]
-        }
-        self._write_json('great-work-object-types.json', great_work_object_types)
+        self._write_id_list('great-work-object-types.json', self.data['great_work_object_types'])
 
         # ResourceClass
-        resource_classes = {
-            'values': [{'id': rc} for rc in sorted(self.data['resource_classes'])]
-        }
-        self._write_json('resource-classes.json', resource_classes)
+        self._write_id_list('resource-classes.json', self.data['resource_classes'])
 
         # HandicapSystemType
-        handicap_system_types = {
-            'values': [{'id': hst} for hst in sorted(self.data['handicap_system_types'])]
-        }
-        self._write_json('handicap-system-types.json', handicap_system_types)
+        self._write_id_list('handicap-system-types.json', self.data['handicap_system_types'])
 
         # Leader
-        leaders = {
-            'values': [{'id': l} for l in sorted(self.data['leaders'])]
-        }
-        self._write_json('leaders.json', leaders)
+        self._write_id_list('leaders.json', self.data['leaders'])
 
         # Unit
         units = {
@@ -1129,16 +1098,10 @@ class CivVIIDataExtractor:
         self._write_json('unit-abilities.json', unit_abilities)
 
         # LeaderAttribute
-        leader_attributes = {
-            'values': [{'id': la} for la in sorted(self.data['leader_attributes'])]
-        }
-        self._write_json('leader-attributes.json', leader_attributes)
+        self._write_id_list('leader-attributes.json', self.data['leader_attributes'])
 
         # Civilization Traits (TRAIT_ATTRIBUTE_* and civilization variants)
-        civilization_traits = {
-            'values': [{'id': t} for t in sorted(self.data['civilization_traits'])]
-        }
-        self._write_json('civilization-traits.json', civilization_traits)
+        self._write_id_list('civilization-traits.json', self.data['civilization_traits'])
 
         # Civilization
         civilizations = {
@@ -1154,10 +1117,7 @@ class CivVIIDataExtractor:
         self._write_json('civilizations.json', civilizations)
 
         # Constructibles (Buildings, Improvements, Wonders)
-        constructibles = {
-            'values': [{'id': c} for c in sorted(self.data['constructibles'])]
-        }
-        self._write_json('constructibles.json', constructibles)
+        self._write_id_list('constructibles.json', self.data['constructibles'])
 
         # Traditions (policies)
         traditions = {
@@ -1,11 +1,56 @@
 """Utility functions for property filling and manipulation."""
 
-from typing import Any, Callable, Dict, TypeVar, Generic
+from typing import Any, Callable, Dict, Iterator, TypeVar, Generic
+import functools
+import os
 import re
+import sys
+import threading
+import uuid
 
 T = TypeVar("T")
 
+# Random UUIDs are cut from one os.urandom read per batch instead of one
+# syscall per id
+_UUID_BATCH = 256
+_uuid_lock = threading.Lock()
 
+
+def _uuid_pool() -> Iterator[str]:
+    """Yield random (version 4) UUID strings, refilling in batches."""
+    while True:
+        buf = os.urandom(16 * _UUID_BATCH)
+        for i in range(0, len(buf), 16):
+            yield str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+
+
+_uuid_pool_iter = _uuid_pool()
+
+
+def _reset_uuid_pool() -> None:
+    """Discard the buffered ids so a forked child never reuses its parent's."""
+    global _uuid_pool_iter
+    _uuid_pool_iter = _uuid_pool()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def uuid4_str() -> str:
+    """
+    Return a new random UUID string, equivalent to str(uuid.uuid4()).
+    
+    Thread-safe; ids are drawn from a pooled batch of random bytes.
+    
+    Returns:
+        UUID string (e.g., '1b4e28ba-2fa1-41d2-883f-0016d3cca427')
+    """
+    with _uuid_lock:
+        return next(_uuid_pool_iter)
+
+
+@functools.lru_cache(maxsize=8192)
 def locale(prefix: str | None, variable: str) -> str:
     """
     Generate localization key from prefix and variable name.
@@ -18,6 +63,10 @@ def locale(prefix: str | None, variable: str) -> str:
         locale('CIVILIZATION_GONDOR', 'cityNames_1') -> 'LOC_CIVILIZATION_GONDOR_CITY_NAMES_1'
         locale('UNIT_GONDOR_SCOUT', 'description') -> 'LOC_UNIT_GONDOR_SCOUT_DESCRIPTION'
     
+    Results are memoized and interned: the same (prefix, variable) pairs
+    recur across every localization of a mod build, and the tags end up as
+    keys in downstream dicts.
+    
     Args:
         prefix: Prefix for the localization key (e.g., 'CIVILIZATION_GONDOR')
         variable: Variable name in camelCase or snake_case
@@ -33,7 +82,7 @@ def locale(prefix: str | None, variable: str) -> str:
     snake = re.sub('([a-z0-9])([A-Z])', r'\1_\2', variable)
     snake = snake.upper()
     
-    return f"LOC_{prefix}_{snake}"
+    return sys.intern(f"LOC_{prefix}_{snake}")
 
 
 def fill(obj: T, payload: Dict[str, Any]) -> T:
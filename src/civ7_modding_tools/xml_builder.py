@@ -1,7 +1,127 @@
 """Custom XML builder for attribute-based XML generation matching TypeScript output."""
 
-from typing import Any, Dict, List, Union, Optional
-import xml.etree.ElementTree as ET
+import io
+from typing import Any, Dict, List, NamedTuple, TextIO, Union, Optional
+
+
+def _escape_text(text: str) -> str:
+    """
+    Escape &, < and > in a text node.
+    
+    Each replace only runs when its character is present, so the common
+    case (identifiers, LOC keys) is a few C-level scans returning the
+    string unchanged; str.translate with a mapping table is far slower.
+    
+    Args:
+        text: Raw text
+        
+    Returns:
+        Escaped text
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _escape_attr(value: str) -> str:
+    """Escape an attribute value: as _escape_text, plus double quotes."""
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    if '"' in value:
+        value = value.replace('"', "&quot;")
+    return value
+
+# jstoxml dict key -> XmlRow field
+_ROW_KEYS = {'_name': 'name', '_attrs': 'attrs', '_content': 'content'}
+
+
+class XmlRow(NamedTuple):
+    """
+    A serialized element: name, attributes and optional nested content.
+    
+    Node serialization returns rows as this tuple rather than a
+    {'_name': ..., '_attrs': {...}} dict. The jstoxml keys still work for
+    dict-style consumers: row['_attrs'], row.get('_content'), '_name' in row.
+    """
+    name: str
+    attrs: Dict[str, str]
+    content: Any = None
+
+    def __getitem__(self, key: Any) -> Any:
+        """Allow dict-style row['_name'] access alongside tuple indexing."""
+        if isinstance(key, str):
+            return getattr(self, _ROW_KEYS[key])
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key: Any) -> bool:
+        """Return True for the jstoxml keys this row has a value for."""
+        field = _ROW_KEYS.get(key)
+        return field is not None and getattr(self, field) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for a jstoxml key, or default if it is unset."""
+        field = _ROW_KEYS.get(key)
+        if field is None:
+            return default
+        value = getattr(self, field)
+        return default if value is None else value
+
+
+# A serialized element as returned by to_xml_element(): an XmlRow, or a
+# jstoxml dict for nodes that build nested structures by hand
+XmlElement = Union[XmlRow, Dict[str, Any]]
+
+
+def _render_row(row: XmlElement, indent: str, level: int) -> str:
+    """
+    Render a jstoxml row and its nested rows to a single string.
+    
+    Children are rendered recursively and joined, so a whole row costs one
+    stream write instead of one per tag fragment.
+    
+    Args:
+        row: XmlRow or {'_name': ..., '_attrs': ..., '_content': ...} dict
+        indent: Indentation string
+        level: Current indentation level
+        
+    Returns:
+        The row's XML text, without a trailing newline
+    """
+    if type(row) is XmlRow:
+        name, attrs, content = row
+    elif isinstance(row, dict):
+        name = row.get('_name', 'Row')
+        attrs = row.get('_attrs', {})
+        content = row.get('_content')
+    else:
+        raise ValueError(f"Expected dict for row, got {type(row)}")
+    
+    current_indent = indent * level
+    open_tag = f"{current_indent}<{name}"
+    if attrs:
+        open_tag += "".join([f' {k}="{_escape_attr(str(v))}"' for k, v in attrs.items()])
+    
+    if content:
+        if isinstance(content, str):
+            text = content.strip()
+            if text:
+                return f"{open_tag}>{_escape_text(text)}</{name}>"
+        elif isinstance(content, list):
+            children = [
+                _render_row(c, indent, level + 1)
+                for c in content if isinstance(c, (dict, XmlRow))
+            ]
+            if children:
+                return f"{open_tag}>\n" + "\n".join(children) + f"\n{current_indent}</{name}>"
+    return open_tag + "/>"
 
 
 class XmlBuilder:
@@ -35,163 +155,129 @@ class XmlBuilder:
         if not data:
             return ""
         
-        # Create root element
-        root = XmlBuilder._dict_to_element(data)
-        
-        # Convert to string with proper formatting
-        xml_str = XmlBuilder._element_to_string(root, indent)
-        
-        # Add header
+        # Write straight to a text buffer: no Element tree in between
+        out = io.StringIO()
         if header:
-            xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
+            out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        XmlBuilder._write_element(out, data, indent, 0)
         
         # Add footer comment if provided
         if footer_comment:
-            xml_str += '\n' + footer_comment
+            out.write('\n' + footer_comment)
         
-        return xml_str
+        return out.getvalue()
     
     @staticmethod
-    def _element_to_string(element: ET.Element, indent: str = '    ', level: int = 0) -> str:
+    def write_row(out: TextIO,
+                  row: XmlElement,
+                  indent: str = '    ',
+                  level: int = 0) -> None:
         """
-        Convert Element to pretty-printed XML string.
+        Write a jstoxml row straight to a text stream, without building Elements.
+        
+        Produces the same text build() would for the row at this level:
+        attributes in order, self-closing when there is no text or child
+        content, and nested dict/XmlRow content written one level deeper.
         
         Args:
-            element: Element to convert
+            out: Text stream (file or io.StringIO) to write to
+            row: XmlRow or {'_name': ..., '_attrs': ..., '_content': ...} dict
             indent: Indentation string
             level: Current indentation level
-            
-        Returns:
-            Formatted XML string
         """
-        # Build opening tag with attributes
-        attrs_str = ""
-        if element.attrib:
-            attrs_list = [f'{k}="{v}"' for k, v in element.attrib.items()]
-            attrs_str = " " + " ".join(attrs_list)
-        
-        current_indent = indent * level
-        
-        # Handle self-closing tags (no children, no text)
-        if len(element) == 0 and not (element.text and element.text.strip()):
-            return f"{current_indent}<{element.tag}{attrs_str}/>"
-        
-        # Has children or text
-        result = f"{current_indent}<{element.tag}{attrs_str}>"
-        
-        # Add text content if present
-        if element.text and element.text.strip():
-            result += element.text.strip()
-        
-        # Add children
-        if len(element) > 0:
-            result += "\n"
-            for child in element:
-                result += XmlBuilder._element_to_string(child, indent, level + 1) + "\n"
-            result += current_indent
-        
-        result += f"</{element.tag}>"
-        
-        return result
+        out.write(_render_row(row, indent, level))
     
     @staticmethod
-    def _dict_to_element(data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> ET.Element:
+    def _write_element(out: TextIO,
+                       data: Any,
+                       indent: str,
+                       level: int) -> None:
         """
-        Convert jstoxml-format dictionary to XML Element.
+        Write a jstoxml-format element to a text stream.
         
         Expected formats:
         1. Root element: {'Database': {...}}
         2. Table with rows: {'Types': [{'_name': 'Row', '_attrs': {...}}, ...]}
-        3. Single row: {'_name': 'Row', '_attrs': {'Type': 'VALUE'}}
+        3. Single row: {'_name': 'Row', '_attrs': {'Type': 'VALUE'}} or XmlRow
         
         Args:
-            data: jstoxml-format dictionary or list
-            
-        Returns:
-            XML Element tree
+            out: Text stream to write to
+            data: jstoxml-format dictionary or row (anything else raises ValueError)
+            indent: Indentation string
+            level: Current indentation level
         """
+        if isinstance(data, XmlRow):
+            XmlBuilder.write_row(out, data, indent, level)
+            return
         if not isinstance(data, dict):
             raise ValueError(f"Expected dict, got {type(data)}")
         
-        # Handle root element (should have single key for root tag)
-        root_keys = list(data.keys())
-        
         # Check if this is a node element (has _name and _attrs)
         if '_name' in data and '_attrs' in data:
-            # This is a single node element
-            elem = ET.Element(data['_name'])
-            for key, value in data['_attrs'].items():
-                elem.set(key, str(value))
-            return elem
+            # This is a single node element (attributes only)
+            XmlBuilder.write_row(out, XmlRow(data['_name'], data['_attrs']), indent, level)
+            return
         
         # This is a container element - find root tag
-        if len(root_keys) == 1:
-            root_tag = root_keys[0]
-            root_content = data[root_tag]
-            root = ET.Element(root_tag)
-            
-            # Process root content
-            if isinstance(root_content, dict):
-                # Root content is a dictionary of child elements/tables
-                for table_name, table_content in root_content.items():
-                    if isinstance(table_content, list):
-                        # Table with multiple rows
-                        table_elem = ET.SubElement(root, table_name)
-                        for row in table_content:
-                            row_elem = XmlBuilder._create_row_element(row)
-                            table_elem.append(row_elem)
-                    elif isinstance(table_content, dict):
-                        # Single child or nested structure
-                        if '_name' in table_content and '_attrs' in table_content:
-                            # Single row element
-                            table_elem = ET.SubElement(root, table_name)
-                            row_elem = XmlBuilder._create_row_element(table_content)
-                            table_elem.append(row_elem)
-                        else:
-                            # Nested structure
-                            child_elem = XmlBuilder._dict_to_element({table_name: table_content})
-                            root.append(child_elem)
-            
-            return root
-        else:
+        root_keys = list(data.keys())
+        if len(root_keys) != 1:
             raise ValueError(f"Root should have single key, got {root_keys}")
+        root_tag = root_keys[0]
+        root_content = data[root_tag]
+        
+        # Root content is a dictionary of child tables/elements; anything
+        # else leaves the root empty
+        children = []
+        if isinstance(root_content, dict):
+            children = [
+                (name, content) for name, content in root_content.items()
+                if isinstance(content, (list, dict, XmlRow))
+            ]
+        
+        write = out.write
+        current_indent = indent * level
+        if not children:
+            write(f"{current_indent}<{root_tag}/>")
+            return
+        
+        write(f"{current_indent}<{root_tag}>\n")
+        for name, content in children:
+            if isinstance(content, list):
+                # Table with multiple rows
+                XmlBuilder._write_table(out, name, content, indent, level + 1)
+            elif '_name' in content and '_attrs' in content:
+                # Single row element
+                XmlBuilder._write_table(out, name, [content], indent, level + 1)
+            else:
+                # Nested structure
+                XmlBuilder._write_element(out, {name: content}, indent, level + 1)
+            write("\n")
+        write(f"{current_indent}</{root_tag}>")
     
     @staticmethod
-    def _create_row_element(row_data: Dict[str, Any]) -> ET.Element:
+    def _write_table(out: TextIO,
+                     name: str,
+                     rows: List[XmlElement],
+                     indent: str,
+                     level: int) -> None:
         """
-        Create a Row element from jstoxml row data.
-        
-        Expected format: {'_name': 'Row', '_attrs': {'Type': 'VALUE', ...}}
+        Write a table element and its rows to a text stream.
         
         Args:
-            row_data: Row data dictionary
-            
-        Returns:
-            XML Element for the row
+            out: Text stream to write to
+            name: Table element name
+            rows: Rows in jstoxml format
+            indent: Indentation string
+            level: Indentation level of the table element
         """
-        if not isinstance(row_data, dict):
-            raise ValueError(f"Expected dict for row, got {type(row_data)}")
-        
-        # Get element name (_name) and attributes (_attrs)
-        elem_name = row_data.get('_name', 'Row')
-        attrs = row_data.get('_attrs', {})
-        content = row_data.get('_content')
-        
-        # Create element
-        elem = ET.Element(elem_name)
-        
-        # Add attributes
-        for key, value in attrs.items():
-            elem.set(key, str(value))
-        
-        # Add nested content if provided
-        if content:
-            if isinstance(content, str):
-                elem.text = content
-            elif isinstance(content, list):
-                for child in content:
-                    if isinstance(child, dict):
-                        child_elem = XmlBuilder._create_row_element(child)
-                        elem.append(child_elem)
-        
-        return elem
+        write = out.write
+        current_indent = indent * level
+        if not rows:
+            write(f"{current_indent}<{name}/>")
+            return
+        
+        write(f"{current_indent}<{name}>\n")
+        for row in rows:
+            XmlBuilder.write_row(out, row, indent, level + 1)
+            write("\n")
+        write(f"{current_indent}</{name}>")
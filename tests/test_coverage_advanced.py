@@ -130,7 +130,15 @@ class TestActionGroupNode:
         criteria_xml = xml['_content']['Criteria']
         assert criteria_xml['_attrs'].get('any') == 'true'
         assert len(criteria_xml['_content']['AgeInUse']) == 3
-    
+
+    def test_action_group_node_keeps_payload_criteria(self):
+        """Test ActionGroupNode uses the payload's criteria instead of a default."""
+        criteria = CriteriaNode({'id': 'given-criteria'})
+        node = ActionGroupNode({'id': 'ag', 'criteria': criteria})
+
+        assert node.criteria is criteria
+        assert node.criteria.id == 'given-criteria'
+
     def test_action_group_node_fill_method(self):
         """Test ActionGroupNode fill() method."""
         node = ActionGroupNode()
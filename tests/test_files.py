@@ -107,3 +107,135 @@ def test_import_file_source_not_found():
     
     with pytest.raises(FileNotFoundError):
         import_file.write("/tmp")
+
+
+def test_xml_file_write_recreates_removed_dir(tmp_path):
+    """Test that writing again after the output dir was removed recreates it."""
+    import shutil
+
+    node = BaseNode()
+    node.test_attr = "value"
+    xml_file = XmlFile(path="/output/", name="data.xml", content=[node])
+
+    xml_file.write(str(tmp_path))
+    shutil.rmtree(tmp_path / "output")
+    xml_file.write(str(tmp_path))
+
+    assert (tmp_path / "output" / "data.xml").exists()
+
+
+def test_xml_file_game_effects_escapes_text(tmp_path):
+    """Test that GameEffects output is well-formed and keeps compact empty tags."""
+    import xml.etree.ElementTree as ET
+    from civ7_modding_tools.nodes import GameEffectNode, ModifierNode
+
+    modifier = ModifierNode().fill({
+        "id": "MOD_TEST",
+        "collection": "COLLECTION_OWNER",
+        "effect": "EFFECT_TEST",
+        "arguments": [{"name": "Text", "value": "a & <b>"}],
+    })
+    game_effects = GameEffectNode()
+    game_effects.modifiers = [modifier]
+
+    XmlFile(path="/", name="effects.xml", content=game_effects).write(str(tmp_path))
+
+    content = (tmp_path / "effects.xml").read_text()
+    assert "a &amp; &lt;b&gt;" in content
+    assert " />" not in content
+    ET.fromstring(content.split("\n<!--")[0].split("?>\n", 1)[1])
+
+
+def test_xml_file_game_effects_strips_text(tmp_path):
+    """Test that GameEffects text is stripped and whitespace-only text self-closes."""
+    from civ7_modding_tools.nodes.nodes import GameEffectNode, ModifierNode
+
+    modifier = ModifierNode().fill({
+        "id": "MOD_TEST",
+        "collection": "COLLECTION_OWNER",
+        "effect": "EFFECT_TEST",
+        "arguments": [
+            {"name": "Amount", "value": "  5  "},
+            {"name": "Blank", "value": "   "},
+        ],
+    })
+    game_effects = GameEffectNode()
+    game_effects.modifiers = [modifier]
+
+    XmlFile(path="/", name="effects.xml", content=game_effects).write(str(tmp_path))
+
+    content = (tmp_path / "effects.xml").read_text()
+    assert '<Argument name="Amount">5</Argument>' in content
+    assert '<Argument name="Blank"/>' in content
+
+
+def test_xml_file_database_escapes_values(tmp_path):
+    """Test that Database rows escape attribute and text values."""
+    from civ7_modding_tools.nodes import DatabaseNode, EnglishTextNode
+
+    database = DatabaseNode()
+    database.english_text = [EnglishTextNode(tag="LOC_TEST", text='Rome & "Friends"')]
+
+    XmlFile(path="/", name="text.xml", content=database).write(str(tmp_path))
+
+    content = (tmp_path / "text.xml").read_text()
+    assert 'Rome &amp; "Friends"' in content
+
+
+def test_write_many_writes_all_file_types(tmp_path):
+    """Test that write_many writes XML, JS and import files."""
+    from civ7_modding_tools.files import BaseFile, JsFile
+
+    source_file = tmp_path / "icon.png"
+    source_file.write_bytes(b"fake image data")
+
+    node = BaseNode()
+    node.test_attr = "value"
+    files = [
+        XmlFile(path="/data/", name=f"data{i}.xml", content=[node]) for i in range(5)
+    ] + [
+        JsFile(path="/ui/", name="script.js", content="console.log('x');"),
+        ImportFile(path="/icons/", name="icon.png", content=str(source_file)),
+        XmlFile(path="/data/", name="empty.xml", content=None),
+    ]
+
+    BaseFile.write_many(files, str(tmp_path / "dist"), max_workers=4)
+
+    dist = tmp_path / "dist"
+    for i in range(5):
+        assert "TestAttr" in (dist / "data" / f"data{i}.xml").read_text()
+    assert (dist / "ui" / "script.js").read_text() == "console.log('x');"
+    assert (dist / "icons" / "icon.png").read_bytes() == b"fake image data"
+    assert not (dist / "data" / "empty.xml").exists()
+
+
+def test_import_file_write_overwrites_existing(tmp_path):
+    """Test that re-writing an import replaces an existing output file."""
+    source_file = tmp_path / "icon.png"
+    source_file.write_bytes(b"new image data")
+
+    dest_dir = tmp_path / "dest"
+    existing = dest_dir / "imports" / "icon.png"
+    existing.parent.mkdir(parents=True)
+    existing.write_bytes(b"old image data")
+
+    ImportFile(path="/imports/", name="icon.png", content=str(source_file)).write(str(dest_dir))
+
+    assert existing.read_bytes() == b"new image data"
+
+
+def test_import_file_write_copies_independent_file(tmp_path):
+    """Test that imports are copied (not linked) and keep the source mtime."""
+    import os
+
+    source_file = tmp_path / "icon.png"
+    source_file.write_bytes(b"source data")
+    os.utime(source_file, (1_000_000_000, 1_000_000_000))
+
+    dest_dir = tmp_path / "dest"
+    ImportFile(path="/imports/", name="icon.png", content=str(source_file)).write(str(dest_dir))
+
+    copied_file = dest_dir / "imports" / "icon.png"
+    assert copied_file.stat().st_mtime == source_file.stat().st_mtime
+    copied_file.write_bytes(b"edited")
+    assert source_file.read_bytes() == b"source data"
@@ -1,8 +1,10 @@
 ﻿"""Tests for Phase 3: Localization implementations."""
 
 import pytest
+from typing import List, Optional
 from civ7_modding_tools.localizations import (
     BaseLocalization,
+    LocNode,
     CivilizationLocalization,
     UnitLocalization,
     ConstructibleLocalization,
@@ -13,6 +15,7 @@ from civ7_modding_tools.localizations import (
     LeaderUnlockLocalization,
     CivilizationUnlockLocalization,
     UniqueQuarterLocalization,
+    localized,
 )
 
 
@@ -35,6 +38,29 @@ class TestBaseLocalization:
         repr_str = repr(loc)
         assert "BaseLocalization" in repr_str
 
+    def test_localization_repr_omits_unset_fields(self):
+        """Test that repr lists populated fields only."""
+        loc = UnitLocalization(name="Legion")
+        assert repr(loc) == "UnitLocalization(name='Legion')"
+
+    def test_localization_field_assigned_after_init_produces_nodes(self):
+        """Test that fields assigned after construction still produce nodes."""
+        loc = UnitLocalization()
+        assert loc.get_nodes("UNIT_TEST") == []
+
+        loc.name = "Legion"
+        nodes = loc.get_nodes("UNIT_TEST")
+        assert [(n["tag"], n["text"]) for n in nodes] == [("LOC_UNIT_TEST_NAME", "Legion")]
+
+    def test_localization_list_mutated_in_place_produces_nodes(self):
+        """Test that items appended to a list field after construction are emitted."""
+        loc = CivilizationLocalization(city_names=[])
+        loc.city_names.append("Ur")
+        nodes = loc.get_nodes("CIVILIZATION_TEST")
+        assert [(n["tag"], n["text"]) for n in nodes] == [
+            ("LOC_CIVILIZATION_TEST_CITY_NAMES_1", "Ur")
+        ]
+
     def test_base_localization_fill(self):
         """Test filling with arbitrary data."""
         loc = BaseLocalization(
@@ -45,6 +71,28 @@ class TestBaseLocalization:
         assert data["field1"] == "value1"
         assert data["field2"] == "value2"
 
+    def test_localized_decorator_derives_fields(self):
+        """Test that @localized builds _FIELDS from declared fields."""
+        @localized(rename={"lore": "historicalContext"}, skip=("internal",))
+        class CustomLocalization(BaseLocalization):
+            name: Optional[str] = None
+            full_name: Optional[str] = None
+            lore: Optional[str] = None
+            internal: Optional[str] = None
+            city_names: Optional[List[str]] = None
+
+        assert CustomLocalization._FIELDS == (
+            ("name", "name"),
+            ("full_name", "fullName"),
+            ("lore", "historicalContext"),
+            ("city_names", "cityNames_*"),
+        )
+        loc = CustomLocalization(full_name="Full", internal="x", city_names=["A"])
+        assert [n.tag for n in loc.get_nodes("CIV_X")] == [
+            "LOC_CIV_X_FULL_NAME",
+            "LOC_CIV_X_CITY_NAMES_1",
+        ]
+
 
 class TestCivilizationLocalization:
     """Tests for CivilizationLocalization."""
@@ -661,9 +709,8 @@ class TestLocalizationIntegration:
             nodes = loc.get_nodes("TEST_ENTITY")
             assert isinstance(nodes, list)
             if nodes:  # If any nodes exist
-                assert isinstance(nodes[0], dict)
-                assert "tag" in nodes[0]
-                assert "text" in nodes[0]
+                assert isinstance(nodes[0], LocNode)
+                assert nodes[0]._fields == ("tag", "text")
     
     def test_node_structure(self):
         """All nodes have correct structure with tag and text."""
@@ -676,9 +723,7 @@ class TestLocalizationIntegration:
         nodes = loc.get_nodes("CIVILIZATION_ROME")
         
         for node in nodes:
-            assert isinstance(node, dict)
-            assert "tag" in node
-            assert "text" in node
+            assert isinstance(node, LocNode)
             assert isinstance(node["tag"], str)
             assert isinstance(node["text"], str)
             assert len(node["tag"]) > 0
@@ -1,6 +1,10 @@
 """Tests for all node implementations."""
 
+import sys
+from io import StringIO
+
 import pytest
+from pydantic import Field
 from civ7_modding_tools.nodes import (
     BaseNode,
     DatabaseNode,
@@ -30,8 +34,13 @@ from civ7_modding_tools.nodes import (
     UnitReplaceNode,
     VisArtCivilizationBuildingCultureNode,
     VisArtCivilizationUnitCultureNode,
+    IconDefinitionNode,
+    LegacyIndependentsUpdateNode,
+    UpdateSetNode,
+    UpdateWhereNode,
 )
 from civ7_modding_tools.utils import camel_to_pascal, locale, trim, kebab_case
+from civ7_modding_tools.xml_builder import XmlBuilder, XmlRow
 
 
 # ============================================================================
@@ -56,6 +65,18 @@ def test_base_node_fill():
     assert node.another == 42
 
 
+def test_base_node_fill_without_validation():
+    """Test fill(validate=False) writes declared fields and extras."""
+    node = KindNode()
+    result = node.fill({"kind": "KIND_UNIT", "extra_prop": "x"}, validate=False)
+
+    assert result is node
+    assert node.kind == "KIND_UNIT"
+    assert "kind" in node.model_fields_set
+    assert node.extra_prop == "x"
+    assert node.to_xml_element()["_attrs"]["KIND"] == "KIND_UNIT"
+
+
 def test_base_node_to_xml_element():
     """Test conversion to XML element dict."""
     node = BaseNode()
@@ -120,6 +141,84 @@ def test_base_node_empty_returns_none():
     assert xml_elem is None
 
 
+def test_base_node_precomputes_xml_keys():
+    """Test that subclasses precompute XML attribute names for their fields."""
+    assert [(f.py, f.xml) for f in KindNode._FIELDS] == [("kind", "Kind")]
+    spec = BuildingNode._FIELDS[0]
+    assert (spec.py, spec.xml) == ("constructible_type", "ConstructibleType")
+    assert spec.xml is sys.intern("ConstructibleType")
+    assert BaseNode._FIELDS == ()
+    assert KindNode._field_keys == frozenset(KindNode.model_fields)
+
+
+def test_base_node_typed_field_writers():
+    """Test per-type field writers keep the generic stringification rules."""
+    class TypedNode(BaseNode):
+        label: str | None = None
+        flag: bool | None = None
+        amount: int | None = None
+
+    node = TypedNode(label="", flag=False, amount=3)
+    assert node.to_xml_element()["_attrs"] == {"Flag": "false", "Amount": "3"}
+
+    # Values that don't match the annotation still stringify
+    node.label = 5
+    node.flag = "yes"
+    assert node.to_xml_element()["_attrs"]["Label"] == "5"
+    assert node.to_xml_element()["_attrs"]["Flag"] == "yes"
+
+    # Identifier-like fields share one string object per value across rows
+    built = "".join(["UNIT_", "TYPED"])
+    row = TypeNode(type_=built, kind="KIND_UNIT").to_xml_element()
+    assert row["_attrs"]["Type"] is sys.intern("UNIT_TYPED")
+
+    # fill() interns identifier values as they come in, on both paths
+    for validate in (True, False):
+        node = TypeNode().fill({"type_": "".join(["UNIT_", "FILLED"])}, validate=validate)
+        assert node.type_ is sys.intern("UNIT_FILLED")
+
+
+def test_base_node_field_writers_keep_order():
+    """Test that declared fields serialize in declaration order and skip empties."""
+    class OrderedNode(BaseNode):
+        second_field: str | None = None
+        first_field: int | None = None
+
+    node = OrderedNode(first_field=0, second_field="b")
+    assert list(node.to_xml_element()["_attrs"]) == ["SecondField", "FirstField"]
+    assert OrderedNode().to_xml_element() is None
+    assert BaseNode(extra_value=1).to_xml_element()["_attrs"] == {"ExtraValue": "1"}
+
+
+def test_base_node_returns_xml_row():
+    """Test that rows are XmlRow tuples that still read like jstoxml dicts."""
+    row = KindNode(kind="KIND_X").to_xml_element()
+    assert row == XmlRow("InsertOrIgnore", {"KIND": "KIND_X"})
+    assert row["_name"] == row.name == "InsertOrIgnore"
+    assert "_attrs" in row and "_content" not in row
+    assert row.get("_content", []) == []
+
+
+def test_base_node_name_is_class_level():
+    """Test that the element name lives on the class, including annotated overrides."""
+    class AnnotatedNode(BaseNode):
+        _name: str = "Custom"
+        value: str | None = None
+
+    assert KindNode()._name == "InsertOrIgnore"
+    assert not KindNode().__pydantic_private__
+    assert AnnotatedNode(value="x").to_xml_element()["_name"] == "Custom"
+
+
+def test_base_node_annotated_name_without_default_keeps_inherited():
+    """Test that a bare `_name: str` annotation keeps the inherited element name."""
+    class BareAnnotatedNode(BaseNode):
+        _name: str
+        value: str | None = None
+
+    assert BareAnnotatedNode._name == "Row"
+    assert BareAnnotatedNode(value="x").to_xml_element()["_name"] == "Row"
+
 
 def test_camel_to_pascal():
     """Test camelCase to PascalCase conversion."""
@@ -157,6 +256,13 @@ class TestDatabaseNode:
         ]
         assert len(list_properties) >= 50  # At least 50 properties as in TypeScript
 
+    def test_database_node_dump_includes_every_table(self):
+        """Every declared table should be present (empty) on a new database."""
+        db = DatabaseNode()
+        assert db.model_dump().keys() == DatabaseNode.model_fields.keys()
+        db.kinds.append(KindNode(kind="KIND_A"))
+        assert db.to_xml_element()["Database"]["Kinds"][0]["_attrs"] == {"KIND": "KIND_A"}
+
     def test_database_node_accepts_payload(self):
         """DatabaseNode should accept initialization payload."""
         kind_node = KindNode(kind="KIND_TYPE")
@@ -220,6 +326,56 @@ class TestDatabaseNode:
         assert len([k for k in db_data.keys()]) >= 1  # At least kinds table
 
 
+    def test_database_node_subclass_tables_follow_preferred_order(self):
+        """Subclass table fields are serialized after the preferred tables."""
+        class ExtendedDatabaseNode(DatabaseNode):
+            custom_rows: list[BaseNode] = Field(default_factory=list)
+
+        db = ExtendedDatabaseNode({
+            "custom_rows": [BaseNode(value="x")],
+            "types": [TypeNode(type_="T1")],
+            "kinds": [KindNode(kind="K1")],
+        })
+        tables = db.to_xml_element()["Database"]
+        assert list(tables) == ["Kinds", "Types", "CustomRows"]
+        assert tables["CustomRows"] == [XmlRow("Row", {"Value": "x"})]
+
+
+    def test_database_node_write_xml_matches_xml_builder(self):
+        """Streamed Database XML should match XmlBuilder output exactly."""
+        db = DatabaseNode({
+            "kinds": [KindNode(kind="KIND_A")],
+            "types": [TypeNode(), TypeNode(type_='T & "1" <x>', kind="KIND_A")],
+            "tags": [TagNode()],
+            "icon_definitions": [IconDefinitionNode(id="ICON_A", path="fs://a", icon_size="64")],
+            "legacy_independents": [LegacyIndependentsUpdateNode(
+                where_clause=UpdateWhereNode(independent_type="IND_A"),
+                set_clause=UpdateSetNode(name="B"),
+            )],
+        })
+        out = StringIO()
+        db.write_xml(out)
+        expected = XmlBuilder.build(db.to_xml_element(), header=False)
+        assert out.getvalue() == expected
+        assert "<Tags>" not in expected
+
+        empty = StringIO()
+        DatabaseNode().write_xml(empty)
+        assert empty.getvalue() == ""
+
+    def test_database_node_iter_xml_yields_rows_lazily(self):
+        """iter_xml should yield (table, row) pairs in output order, skipping empties."""
+        db = DatabaseNode({
+            "types": [TypeNode(), TypeNode(type_="T_A", kind="KIND_A")],
+            "kinds": [KindNode(kind="KIND_A")],
+            "tags": [TagNode()],
+        })
+        rows = db.iter_xml()
+        assert next(rows) == ("Kinds", KindNode(kind="KIND_A").to_xml_element())
+        assert [table for table, _ in rows] == ["Types"]
+        assert list(DatabaseNode().iter_xml()) == []
+
+
 # ============================================================================
 # Type System Node Tests
 # ============================================================================
@@ -445,6 +601,25 @@ class TestModifierRequirementNode:
         assert xml['_name'] == 'Requirement'
         assert xml['_attrs']['type'] == 'REQUIREMENT_UNIT_TAG_MATCHES'
 
+    def test_modifier_requirement_dicts_match_node_output(self):
+        """Modifier requirement dicts serialize like the equivalent nodes."""
+        from civ7_modding_tools.nodes.nodes import ArgumentNode, ModifierNode
+
+        node = ModifierNode(
+            id="MOD_TEST",
+            requirements=[
+                {'type': 'REQUIREMENT_A', 'arguments': [{'name': 'Tag', 'value': None}]},
+                {'type': ''},
+                {'arguments': []},
+            ],
+            arguments=[{'name': 'Amount', 'value': None}],
+        )
+        xml = node.to_xml_element()
+        requirements = xml['_content'][0]['_content']
+        assert [req['_attrs']['type'] for req in requirements] == ['REQUIREMENT_A']
+        assert requirements[0]['_content'][0]['_content'] == ''
+        assert xml['_content'][1] == ArgumentNode(name='Amount').to_xml_element()
+
 
 class TestStartBiasAdjacentToCoastNode:
     """Tests for StartBiasAdjacentToCoastNode."""
@@ -86,8 +86,9 @@ class TestTraditionBuilder:
         nodes = loc.get_nodes('TRADITION_TEST')
         
         assert len(nodes) > 0
-        # Nodes should be dicts with Name and Value fields
-        assert isinstance(nodes[0], dict)
+        # Nodes should be LocNode records with tag and text fields
+        assert nodes[0].tag == 'LOC_TRADITION_TEST_NAME'
+        assert nodes[0]["text"] == 'Scribal Tradition'
 
     def test_tradition_localization_partial(self):
         """Test TraditionLocalization with only name."""
@@ -8,6 +8,7 @@ from civ7_modding_tools.utils import (
     uniq_by,
     flatten,
     fill,
+    uuid4_str,
 )
 
 
@@ -118,3 +119,16 @@ class TestFill:
         obj = {}
         result = fill(obj, {"key": "value"})
         assert result is obj
+
+
+class TestUuid4Str:
+    """Tests for uuid4_str function."""
+    
+    def test_returns_version_4_uuid(self):
+        import uuid
+        value = uuid.UUID(uuid4_str())
+        assert value.version == 4
+    
+    def test_ids_are_unique_across_batches(self):
+        ids = {uuid4_str() for _ in range(600)}
+        assert len(ids) == 600